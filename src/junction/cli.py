@@ -1,21 +1,28 @@
 import logging
 import click
 import click_log
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 from pathlib import Path
-from git import Repo, Commit
+from git import Repo, Commit, GitCommandError
 
 from junction import __version__
 from junction.confluence import Confluence
 from junction.git import (
     find_repository_root,
+    write_commit_graph,
     find_commits_on_branch_after,
     filter_modifications_to_folder,
-    get_modifications,
+    get_modifications_batch,
+    drop_superseded_modifications,
 )
 from junction.delta import Delta, MovePage, UpdatePage, CreatePage, DeletePage
 
 
+# independent page actions within a delta are sent to Confluence concurrently, up to this limit
+MAX_CONCURRENT_API_CALLS = 8
+
+
 class CliContext(object):
     def __init__(self) -> None:
         self.repo: Optional[Repo] = None
@@ -94,20 +101,31 @@ def _validate_git_dir(ctx: click.Context, param: click.Parameter, value: str) ->
         return path
 
 
-def _validate_commitish(ctx: click.Context, param: click.Parameter, value: str) -> str:
+def _commit_exists(repo: Repo, commitish: str) -> bool:
+    # only checks the object exists and peels to a commit; unlike repo.commit() nothing is parsed into python
     try:
-        if ctx.obj.repo.commit(value):
-            return value
-        else:
-            raise click.BadParameter("no commit found by dereferencing that commitish")
-    except Exception:
+        return bool(
+            repo.git.rev_parse("--verify", "--quiet", f"{commitish}^{{commit}}")
+        )
+    except GitCommandError:
+        return False
+
+
+def _branch_exists(repo: Repo, branch: str) -> bool:
+    return branch in repo.heads
+
+
+def _validate_commitish(ctx: click.Context, param: click.Parameter, value: str) -> str:
+    if _commit_exists(ctx.obj.repo, value):
+        return value
+    else:
         raise click.BadParameter(
             "this is an invalid commit-ish; valid examples include HEAD~3 or a commit SHA"
         )
 
 
 def _validate_branch(ctx: click.Context, param: click.Parameter, value: str) -> str:
-    if value in ctx.obj.repo.heads:
+    if _branch_exists(ctx.obj.repo, value):
         return value
     else:
         raise click.BadParameter("you must provide a valid branch name e.g. master")
@@ -137,6 +155,14 @@ def _validate_branch(ctx: click.Context, param: click.Parameter, value: str) ->
     type=bool,
     help="Do not write any changes to the wiki and instead print out what would have been done and exit.",
 )
+@click.option(
+    "--write-commit-graph",
+    "commit_graph",
+    default=False,
+    is_flag=True,
+    type=bool,
+    help="Write a commit-graph with changed-path Bloom filters into the git repository before scanning it, which speeds up finding changes under content-path in large repositories.  The first write walks the entire history.  Ignored with --dry-run.",
+)
 @click.pass_obj
 def delta(
     my_ctx: CliContext,
@@ -145,6 +171,7 @@ def delta(
     git_dir: Path,
     content_path: str,
     dry_run: bool,
+    commit_graph: bool,
 ) -> None:
     """Updates Confluence by finding modifications in a git repository.
 
@@ -161,20 +188,34 @@ def delta(
         )
 
     filter_path = Path(content_path) if content_path else git_dir
-    commits = find_commits_on_branch_after(branch, since, my_ctx.repo)
-    deltas = {
-        c: Delta.from_modifications(
-            filter_modifications_to_folder(get_modifications(c), filter_path)
-        )
+    # a dry run must leave the repository untouched too
+    if commit_graph and not dry_run:
+        write_commit_graph(my_ctx.repo)
+    commits = find_commits_on_branch_after(branch, since, my_ctx.repo, filter_path)
+    modifications = get_modifications_batch(commits, filter_path)
+    modifications_by_commit = [
+        list(filter_modifications_to_folder(modifications[c.hexsha], filter_path))
         for c in commits
-    }
+    ]
 
     if dry_run:
-        __pretty_print_deltas(deltas)
+        # describe every commit as it is, including writes that a later commit would make redundant
+        __pretty_print_deltas(
+            {
+                c: Delta.from_modifications(mods)
+                for c, mods in zip(commits, modifications_by_commit)
+            }
+        )
     else:
         if my_ctx.confluence:
-            for delta in deltas.values():
-                delta.execute(my_ctx.confluence)
+            # commits are replayed in order, so a page only needs the last of several writes
+            deltas = [
+                Delta.from_modifications(mods)
+                for mods in drop_superseded_modifications(modifications_by_commit)
+            ]
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_API_CALLS) as executor:
+                for delta in deltas:
+                    delta.execute(my_ctx.confluence, executor)
         else:
             raise RuntimeError(
                 "Confluence API client was not setup, but this should never happen; file a bug."
@@ -191,25 +232,28 @@ def __pretty_print_deltas(deltas: Dict[Commit, Delta]) -> None:
             + delta.start_renames
             + delta.finish_renames
         )
-        click.echo(
+        # each commit is written out in one go rather than a line (and flush) at a time
+        lines = [
             f"{commit.hexsha} ({click.style(str(len(all_operations)), fg='cyan')} changes)"
-        )
+        ]
         for op in all_operations:
             if isinstance(op, CreatePage):
-                click.echo(
-                    f"\t{click.style('CREATE', fg='green')} {' / '.join(op.ancestor_titles + [op.title])}"
+                lines.append(
+                    f"\t{click.style('CREATE', fg='green')} {' / '.join((*op.ancestor_titles, op.title))}"
                 )
             elif isinstance(op, UpdatePage):
-                click.echo(
-                    f"\t{click.style('UPDATE', fg='yellow')} {' / '.join(op.ancestor_titles + [op.title])}"
+                lines.append(
+                    f"\t{click.style('UPDATE', fg='yellow')} {' / '.join((*op.ancestor_titles, op.title))}"
                 )
             elif isinstance(op, DeletePage):
-                click.echo(f"\t{click.style('DELETE', fg='red')} ?? / {op.title}")
+                lines.append(f"\t{click.style('DELETE', fg='red')} ?? / {op.title}")
             elif isinstance(op, MovePage):
-                click.echo(
-                    f"\t{click.style('RENAME', fg='blue')} ?? / {op.title} -> {' / '.join(op.ancestor_titles + [op.new_title])}"
+                lines.append(
+                    f"\t{click.style('RENAME', fg='blue')} ?? / {op.title} -> {' / '.join((*op.ancestor_titles, op.new_title))}"
                 )
             else:
-                click.echo(
+                lines.append(
                     f"\t{click.style(type(op).__name__, fg='magenta')} {op.title}"
                 )
+        lines.append("")
+        click.echo("\n".join(lines), nl=False)
@@ -1,7 +1,8 @@
 import requests
 import logging
-from urllib.parse import urlencode, urljoin
-from typing import Union, Sequence, Mapping, Any, Tuple, TypeVar, Type
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Collection, Union, Sequence, Mapping, Any, Tuple, TypeVar, Type
 
 from junction.confluence.models import ApiModel
 from junction.confluence.models.json import ApiEncoder, ApiDecoder
@@ -20,14 +21,46 @@ class _ApiClient(object):
         "Content-Type": "application/json",
     }
 
+    methods_with_body = frozenset(("POST", "PUT", "PATCH"))
+
     def __init__(self, api_url: str, username: str, password: str):
         self.basic_auth = (username, password)
         self.api_url = api_url + "/" if not api_url.endswith("/") else api_url
-        self.__json_encoder = ApiEncoder()
+        # request bodies are trees of ApiModels, so skip the circular reference bookkeeping and
+        # drop the whitespace the default separators add; non-ASCII text (page bodies, titles) is
+        # left as is instead of being expanded into \uXXXX escapes, since bodies are sent as UTF-8
+        self.__json_encoder = ApiEncoder(
+            separators=(",", ":"), check_circular=False, ensure_ascii=False
+        )
+
+        # a single session keeps connections to Confluence alive between calls rather than
+        # paying for a fresh TCP+TLS handshake on every request
+        self._session = requests.Session()
+        self._session.auth = self.basic_auth
+        self._session.headers.update(self.default_headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # once retries run out, hand back the last response so it is logged and raised as an HTTPError
+                # like any other failure, rather than as a RetryError without the response body
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
-    def decode(self, s: str, klass: Type[T]) -> T:
+    def decode(self, s: Union[str, bytes], klass: Type[T]) -> T:
         return ApiDecoder(klass).decode(s)
 
+    def decode_response(self, response: requests.Response, klass: Type[T]) -> T:
+        # decode straight from the raw body; response.text would copy the whole body into a str
+        # (and sniff its charset) before the JSON parser even starts
+        return self.decode(response.content, klass)
+
     def get(
         self,
         resource_path: str,
@@ -39,9 +72,15 @@ class _ApiClient(object):
         ] = None,
         headers: dict = None,
         body: ApiModel = None,
+        expected_statuses: Collection[int] = (),
     ) -> requests.Response:
         return self.__call_api(
-            resource_path, "GET", query_params=query_params, headers=headers, body=body
+            resource_path,
+            "GET",
+            query_params=query_params,
+            headers=headers,
+            body=body,
+            expected_statuses=expected_statuses,
         )
 
     def post(
@@ -55,9 +94,15 @@ class _ApiClient(object):
         ] = None,
         headers: dict = None,
         body: ApiModel = None,
+        expected_statuses: Collection[int] = (),
     ) -> requests.Response:
         return self.__call_api(
-            resource_path, "POST", query_params=query_params, headers=headers, body=body
+            resource_path,
+            "POST",
+            query_params=query_params,
+            headers=headers,
+            body=body,
+            expected_statuses=expected_statuses,
         )
 
     def put(
@@ -71,9 +116,15 @@ class _ApiClient(object):
         ] = None,
         headers: dict = None,
         body: ApiModel = None,
+        expected_statuses: Collection[int] = (),
     ) -> requests.Response:
         return self.__call_api(
-            resource_path, "PUT", query_params=query_params, headers=headers, body=body
+            resource_path,
+            "PUT",
+            query_params=query_params,
+            headers=headers,
+            body=body,
+            expected_statuses=expected_statuses,
         )
 
     def delete(
@@ -87,6 +138,7 @@ class _ApiClient(object):
         ] = None,
         headers: dict = None,
         body: ApiModel = None,
+        expected_statuses: Collection[int] = (),
     ) -> requests.Response:
         return self.__call_api(
             resource_path,
@@ -94,6 +146,7 @@ class _ApiClient(object):
             query_params=query_params,
             headers=headers,
             body=body,
+            expected_statuses=expected_statuses,
         )
 
     def __call_api(
@@ -108,45 +161,41 @@ class _ApiClient(object):
         ] = None,
         headers: dict = None,
         body: ApiModel = None,
+        expected_statuses: Collection[int] = (),
     ) -> requests.Response:
 
-        headers = headers or {}
-        headers.update(self.default_headers)
+        # the constructor guarantees api_url ends with a slash, and resource paths are always relative
+        url = self.api_url + resource_path
 
-        query_string = f"?{urlencode(query_params)}" if query_params else None
-        url = urljoin(urljoin(self.api_url, resource_path), query_string)
+        logger.debug(
+            "Confluence API call %s %s with params %s and headers %s",
+            method,
+            url,
+            query_params,
+            headers,
+        )
 
-        logger.debug("Confluence API call %s %s with headers %s", method, url, headers)
+        data = None
+        if body is not None and method in self.methods_with_body:
+            encoded = self.__json_encoder.encode(body)
+            logger.debug(encoded)
+            # hand requests the bytes to send, so the body isn't re-encoded further down the stack
+            data = encoded.encode("utf-8")
 
-        if method == "GET":
-            response = requests.get(url, auth=self.basic_auth, headers=headers)
-        elif method == "POST":
-            data = self.__json_encoder.encode(body)
-            logger.debug(data)
-            response = requests.post(
-                url,
-                data=data,
-                auth=self.basic_auth,
-                headers=headers,
-            )
-        elif method == "PUT":
-            data = self.__json_encoder.encode(body)
-            logger.debug(data)
-            response = requests.put(
-                url,
-                data=data,
-                auth=self.basic_auth,
-                headers=headers,
-            )
-        elif method == "DELETE":
-            response = requests.delete(url, auth=self.basic_auth, headers=headers)
-        else:
-            raise NotImplementedError(
-                "API client does not support {} method".format(method)
-            )
+        response = self._session.request(
+            method, url, params=query_params, data=data, headers=headers
+        )
 
         if response.status_code < 400:
-            logger.debug("Confluence API response: %s", response.text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Confluence API response: %s", response.text)
+        elif response.status_code in expected_statuses:
+            # the caller handles (and reports) these failures itself
+            logger.debug(
+                "Confluence API failure response %s: %s",
+                response.status_code,
+                response.text,
+            )
         else:
             logger.error(
                 "Confluence API failure response %s: %s",
@@ -1,4 +1,17 @@
-from typing import Any, Type, TypeVar
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from junction.confluence.api import _ApiClient
 from junction.confluence.models import (
@@ -11,11 +24,22 @@ from junction.confluence.models import (
 
 
 BASE_PATH = "content"
+# titles looked up per CQL search by prefetch_pages; keeps the query string well under URL length limits
+PREFETCH_BATCH_SIZE = 25
 
 
 TContent = TypeVar("TContent", bound=Content)
 
 
+def _cql_string(value: str) -> str:
+    """Quotes a value for use in a CQL query."""
+    return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def _has_child_pages(page: Content) -> bool:
+    return bool(page.childTypes and page.childTypes.page and page.childTypes.page.value)
+
+
 class ContentApi(object):
     """The Confluence Content API is used for managing all forms of contents including pages,
     blog posts, comments, attachments, and more.  Pages are well supported; the other types have not been
@@ -28,34 +52,104 @@ class ContentApi(object):
     def __init__(self, api_client: _ApiClient, space_key: str) -> None:
         self.__api_client = api_client
         self.__space_key = space_key
+        # responses of page lookups by title, keyed by (title, expand), while caching_pages is in effect; see
+        # prefetch_pages.  Entries are dropped whenever a write through this API may have changed the page, its
+        # title, its ancestors or its children
+        self.__caching_pages = False
+        self.__page_by_title_cache: Dict[Tuple[str, str], ContentArray[ContentPage]] = (
+            {}
+        )
+
+    @contextmanager
+    def caching_pages(self) -> Iterator[None]:
+        """Caches the pages looked up by title (see get_page and prefetch_pages) until the context exits, at which
+        point the cache is dropped.  Only use this while no changes are made to the wiki outside this API.
+        """
+        if self.__caching_pages:
+            yield
+            return
+
+        self.__caching_pages = True
+        try:
+            yield
+        finally:
+            self.__caching_pages = False
+            self.__page_by_title_cache.clear()
+
+    def __invalidate(
+        self,
+        content_id: Optional[str] = None,
+        content: Union[CreateContent, UpdateContent, None] = None,
+    ) -> None:
+        # the page itself, its old parent (which may have lost its last child), its descendants (whose ancestors
+        # change), and whatever was cached under its new title
+        stale_titles = {content.title} if content and content.title else set()
+        stale_ids: Set[Optional[str]] = set()
+        # the new parent only goes stale if it had no children before
+        new_parent_ids = {a.id for a in content.ancestors or []} if content else set()
+        cached_pages = [
+            (title_key, query.results[0] if query.results else None)
+            for title_key, query in list(self.__page_by_title_cache.items())
+        ]
+        if content_id:
+            stale_ids.add(content_id)
+            for _, page in cached_pages:
+                if page and page.id == content_id and page.ancestors:
+                    stale_ids.add(page.ancestors[-1].id)
+        stale_ids.discard(None)
+
+        for title_key, page in cached_pages:
+            if title_key[0] in stale_titles or (
+                page is not None
+                and (
+                    page.id in stale_ids
+                    or (page.id in new_parent_ids and not _has_child_pages(page))
+                    or any(a.id == content_id for a in page.ancestors or [])
+                )
+            ):
+                self.__page_by_title_cache.pop(title_key, None)
 
     def create_content(self, content: CreateContent, **kwargs: Any) -> Content:
         """https://developer.atlassian.com/cloud/confluence/rest/#api-api-content-post"""
-        response = self.__api_client.post(BASE_PATH, body=content, **kwargs)
-        return self.__api_client.decode(response.text, Content)
+        # cached entries are dropped again once the write is done, in case another thread looked the page up (and
+        # cached what it found) while the write was in flight
+        self.__invalidate(content=content)
+        try:
+            response = self.__api_client.post(BASE_PATH, body=content, **kwargs)
+        finally:
+            self.__invalidate(content=content)
+        return self.__api_client.decode_response(response, Content)
 
     def update_content(
         self, content_id: str, content: UpdateContent, **kwargs: Any
     ) -> Content:
         """https://developer.atlassian.com/cloud/confluence/rest/#api-api-content-id-put"""
-        response = self.__api_client.put(
-            f"{BASE_PATH}/{content_id}", body=content, **kwargs
-        )
-        return self.__api_client.decode(response.text, Content)
+        self.__invalidate(content_id, content)
+        try:
+            response = self.__api_client.put(
+                f"{BASE_PATH}/{content_id}", body=content, **kwargs
+            )
+        finally:
+            self.__invalidate(content_id, content)
+        return self.__api_client.decode_response(response, Content)
 
     def delete_content(self, content_id: str, **kwargs: Any) -> None:
         """https://developer.atlassian.com/cloud/confluence/rest/#api-api-content-id-delete"""
-        self.__api_client.delete(f"{BASE_PATH}/{content_id}", **kwargs)
+        self.__invalidate(content_id)
+        try:
+            self.__api_client.delete(f"{BASE_PATH}/{content_id}", **kwargs)
+        finally:
+            self.__invalidate(content_id)
 
     def _get_content(
         self,
         content_type: Type[TContent],
-        type: str = None,
-        title: str = None,
-        status: str = None,
-        posting_day: str = None,
-        expand: str = None,
-        trigger: str = None,
+        type: Optional[str] = None,
+        title: Optional[str] = None,
+        status: Optional[str] = None,
+        posting_day: Optional[str] = None,
+        expand: Optional[str] = None,
+        trigger: Optional[str] = None,
         start: int = 0,
         limit: int = 25,
         **kwargs: Any,
@@ -82,16 +176,16 @@ class ContentApi(object):
             query_params={k: v for k, v in query_params.items() if v is not None},
             **kwargs,
         )
-        return self.__api_client.decode(response.text, ContentArray[TContent])
+        return self.__api_client.decode_response(response, ContentArray[TContent])
 
     def get_content(
         self,
-        type: str = None,
-        title: str = None,
-        status: str = None,
-        posting_day: str = None,
-        expand: str = None,
-        trigger: str = None,
+        type: Optional[str] = None,
+        title: Optional[str] = None,
+        status: Optional[str] = None,
+        posting_day: Optional[str] = None,
+        expand: Optional[str] = None,
+        trigger: Optional[str] = None,
         start: int = 0,
         limit: int = 25,
         **kwargs: Any,
@@ -111,16 +205,39 @@ class ContentApi(object):
 
     def get_page(
         self,
-        title: str = None,
-        status: str = None,
-        posting_day: str = None,
-        expand: str = None,
-        trigger: str = None,
+        title: Optional[str] = None,
+        status: Optional[str] = None,
+        posting_day: Optional[str] = None,
+        expand: Optional[str] = None,
+        trigger: Optional[str] = None,
         start: int = 0,
         limit: int = 25,
         **kwargs: Any,
     ) -> ContentArray[ContentPage]:
-        return self._get_content(
+        """https://developer.atlassian.com/cloud/confluence/rest/#api-api-content-get
+
+        Within caching_pages, lookups of a single title (with no other filters) that expand the page's ancestors
+        are cached along with the pages fetched by prefetch_pages, so repeated lookups of the same page share (and
+        must not modify) the result.
+        """
+        cache_key = None
+        if (
+            self.__caching_pages
+            and title is not None
+            and expand is not None
+            and "ancestors" in expand.split(",")
+            and status is None
+            and posting_day is None
+            and trigger is None
+            and start == 0
+            and not kwargs
+        ):
+            cache_key = (title, expand)
+            cached = self.__page_by_title_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        query = self._get_content(
             ContentPage,
             type="page",
             title=title,
@@ -132,13 +249,95 @@ class ContentApi(object):
             limit=limit,
             **kwargs,
         )
+        # like prefetch_pages, leave the space homepage (the only page without ancestors) uncached
+        if cache_key and (
+            not query.size or (query.size == 1 and query.results[0].ancestors)
+        ):
+            self.__page_by_title_cache[cache_key] = query
+        return query
+
+    def search_content(
+        self,
+        cql: str,
+        cqlcontext: Optional[str] = None,
+        expand: Optional[str] = None,
+        start: int = 0,
+        limit: int = 25,
+        **kwargs: Any,
+    ) -> ContentArray[Content]:
+        """https://developer.atlassian.com/cloud/confluence/rest/#api-api-content-search-get"""
+        query_params = {
+            "cql": cql,
+            "cqlcontext": cqlcontext,
+            "expand": expand,
+            "start": start,
+            "limit": limit,
+        }
+
+        if "query_params" in kwargs:
+            query_params.update(kwargs["query_params"])
+            del kwargs["query_params"]
+
+        response = self.__api_client.get(
+            f"{BASE_PATH}/search",
+            query_params={k: v for k, v in query_params.items() if v is not None},
+            **kwargs,
+        )
+        return self.__api_client.decode_response(response, ContentArray[Content])
+
+    def prefetch_pages(self, titles: Iterable[str], expand: str) -> None:
+        """Looks up many pages by title with as few CQL searches as possible and caches them, so that subsequent
+        calls to get_page for one of those titles (with the same expand) don't need a request of their own.  Does
+        nothing outside caching_pages.
+
+        Only pages that are found get cached.  The search index can lag behind recent changes, so any title it
+        does not find is still looked up directly by get_page.  The space homepage is never cached either, as
+        writes to any top level page change its children.
+
+        Arguments:
+            titles {Iterable[str]} -- Titles of the pages to look up.
+            expand {str} -- The properties to expand on each page; must include ancestors, which is how writes
+                            find the cached pages they affect.
+
+        Raises:
+            ValueError: If expand does not include ancestors.
+        """
+        if "ancestors" not in expand.split(","):
+            raise ValueError("Prefetched pages must expand their ancestors.")
+        if not self.__caching_pages:
+            return
+
+        unique_titles = sorted(set(titles))
+        for i in range(0, len(unique_titles), PREFETCH_BATCH_SIZE):
+            batch = unique_titles[i : i + PREFETCH_BATCH_SIZE]
+            cql = "space = {} and type = page and title in ({})".format(
+                _cql_string(self.__space_key), ",".join(map(_cql_string, batch))
+            )
+            wanted = set(batch)
+            start = 0
+            while True:
+                found = self.search_content(
+                    cql, expand=expand, start=start, limit=PREFETCH_BATCH_SIZE
+                )
+                for page in found.results:
+                    if (
+                        page.title in wanted
+                        and page.status == "current"
+                        and page.ancestors
+                    ):
+                        self.__page_by_title_cache[(page.title, expand)] = ContentArray(
+                            results=[cast(ContentPage, page)], start=0, size=1
+                        )
+                if not found.size or found.size < PREFETCH_BATCH_SIZE:
+                    break
+                start += found.size
 
     def _get_content_by_id(
         self, content_type: Type[TContent], content_id: str, **kwargs: Any
     ) -> TContent:
         """https://developer.atlassian.com/cloud/confluence/rest/#api-api-content-id-get"""
         response = self.__api_client.get(f"{BASE_PATH}/{content_id}", **kwargs)
-        return self.__api_client.decode(response.text, content_type)
+        return self.__api_client.decode_response(response, content_type)
 
     def get_content_by_id(self, content_id: str, **kwargs: Any) -> Content:
         return self._get_content_by_id(Content, content_id=content_id, **kwargs)
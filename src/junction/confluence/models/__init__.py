@@ -15,35 +15,118 @@ into different modules.  Also makes adding new models easier as there is only on
 Reference model definitions at https://developer.atlassian.com/cloud/confluence/rest/
 """
 
-from typing import List, Union, Any, Optional, Generic, TypeVar
+from typing import (
+    List,
+    Union,
+    Any,
+    Optional,
+    Generic,
+    TypeVar,
+    FrozenSet,
+    Dict,
+    Tuple,
+)
 
 from junction.util import DotDict
 from junction.confluence.models.subclassing import discriminator
 
 
-class ApiModel(object):
+class ApiModelMeta(type):
+    """Metaclass for ApiModel that turns the attributes declared on a model into __slots__.  Instances are
+    then compact (no per-instance __dict__) and attribute access goes straight to a slot.
+
+    The declared defaults are moved off of the class (a slot and a class attribute cannot share a name).
+    Almost all of them are None, which ApiModel returns for any field that was never assigned, so only the
+    other defaults are kept, in __field_defaults__.
+    """
+
+    # the names of every (data) attribute of the model, in declaration order and as a set, plus the defaults
+    # that aren't None; computed once per class so neither construction nor decoding need to probe each key
+    # with hasattr
+    __fields__: Tuple[str, ...]
+    __known_fields__: FrozenSet[str]
+    __field_defaults__: Dict[str, Any]
+    # the public fields, in the (sorted) order they are shown by repr
+    __repr_fields__: Tuple[str, ...]
+
+    def __new__(
+        mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
+    ) -> "ApiModelMeta":
+        inherited_fields: Dict[str, None] = {}
+        inherited_defaults: Dict[str, Any] = {}
+        for base in reversed(bases):
+            inherited_fields.update(dict.fromkeys(getattr(base, "__fields__", ())))
+            inherited_defaults.update(getattr(base, "__field_defaults__", {}))
+
+        defaults: Dict[str, Any] = {}
+        for field in {**namespace.get("__annotations__", {}), **namespace}:
+            value = namespace.get(field)
+            if (
+                field.startswith("__")
+                or callable(value)
+                or isinstance(value, (classmethod, staticmethod, property))
+            ):
+                continue
+            defaults[field] = namespace.pop(field, None)
+
+        namespace["__slots__"] = tuple(
+            field for field in defaults if field not in inherited_fields
+        )
+        klass = super().__new__(mcs, name, bases, namespace)
+        klass.__fields__ = tuple({**inherited_fields, **dict.fromkeys(defaults)})
+        klass.__known_fields__ = frozenset(klass.__fields__)
+        klass.__field_defaults__ = {
+            field: value
+            for field, value in {**inherited_defaults, **defaults}.items()
+            if value is not None
+        }
+        klass.__repr_fields__ = tuple(
+            sorted(
+                field for field in klass.__known_fields__ if not field.startswith("_")
+            )
+        )
+        return klass
+
+
+class ApiModel(object, metaclass=ApiModelMeta):
     def __init__(self, **kwargs: Any):
+        known_fields = type(self).__known_fields__
         for key, value in kwargs.items():
-            assert hasattr(self, key), "{} not a valid attribute of {}".format(
-                key, self.__class__
-            )
+            if key not in known_fields:
+                raise TypeError(
+                    "{} not a valid attribute of {}".format(key, self.__class__)
+                )
             setattr(self, key, value)
 
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes that are not set, which for fields means falling back to their default
+        klass = type(self)
+        if name in klass.__known_fields__:
+            return klass.__field_defaults__.get(name)
+        raise AttributeError("{} has no attribute {}".format(klass, name))
+
     def __repr__(self) -> str:
+        # the fields are known up front, so there's no need to sort and filter dir(self) on every call
         return "<class {}({})>".format(
             self.__class__.__name__,
-            {
-                k: getattr(self, k, None)
-                for k in dir(self)
-                if not k.startswith("_") and k != "encode_json"
-            },
+            {k: getattr(self, k) for k in type(self).__repr_fields__},
         )
 
     def __str__(self) -> str:
         return self.__repr__()
 
     def encode_json(self) -> dict:
-        return self.__dict__
+        # only the attributes that were actually assigned a value, so neither defaults nor explicit nulls
+        # (e.g. left over from a decoded response) end up padding request bodies
+        encoded = {}
+        for name in type(self).__fields__:
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            if value is not None:
+                encoded[name] = value
+        return encoded
 
 
 class Label(ApiModel):
@@ -60,7 +143,7 @@ class LabelArray(ApiModel):
     start: Optional[int] = None
     limit: Optional[int] = None
     size: Optional[int] = None
-    _links: Optional[DotDict]
+    _links: Optional[Dict[str, Any]]
 
 
 class OperationCheckResult(ApiModel):
@@ -177,7 +260,7 @@ class SpacePermissionSubjects(ApiModel):
 
     user: Optional[SpacePermissionUser] = None
     group: Optional[SpacePermissionGroup] = None
-    _expandable: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
 
 
 class SpacePermission(ApiModel):
@@ -191,7 +274,7 @@ class SpacePermission(ApiModel):
 class SpaceSettings(ApiModel):
 
     routeOverrideEnabled: Optional[bool] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class SpaceDescription(ApiModel):
@@ -223,7 +306,7 @@ class SpaceTheme(ApiModel):
     name: Optional[str] = None
     description: Optional[str] = None
     icon: Optional[Icon] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class Space(ApiModel):
@@ -243,8 +326,8 @@ class Space(ApiModel):
     theme: Optional[SpaceTheme] = None
     lookAndFeel: Optional[LookAndFeel] = None
     history: Optional[SpaceHistory] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class EmbeddedContent(ApiModel):
@@ -286,7 +369,7 @@ class Body(ApiModel):
     storage: Optional[ContentBody] = None
     editor2: Optional[ContentBody] = None
     anonymous_export_view: Optional[ContentBody] = None
-    _expandable: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
 
 
 class ContentExtensions(ApiModel):
@@ -352,11 +435,11 @@ class Content(ApiModel):
     containers: Optional[Union[Space, "Content"]] = None
     body: Optional[Body] = None
     restrictions: Optional["ContentRestrictions"] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
-@discriminator(lambda json: json.get("type") == "page")
+@discriminator(("type", "page"))
 class ContentPage(Content):
 
     title: Optional[str] = None
@@ -399,7 +482,7 @@ class ContentArray(Generic[TContent], ApiModel):
     start: Optional[int] = None
     limit: Optional[int] = None
     size: Optional[int] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class ContentChildren(ApiModel):
@@ -407,14 +490,14 @@ class ContentChildren(ApiModel):
     attachment: Optional[ContentArray[Content]] = None
     comment: Optional[ContentArray[Content]] = None
     page: Optional[ContentArray[ContentPage]] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class ContentChildTypeValue(ApiModel):
 
     value: Optional[bool] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class ContentChildType(ApiModel):
@@ -422,7 +505,7 @@ class ContentChildType(ApiModel):
     attachment: Optional[ContentChildTypeValue] = None
     comment: Optional[ContentChildTypeValue] = None
     page: Optional[ContentChildTypeValue] = None
-    _expandable: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
 
 
 class ContentRestriction(ApiModel):
@@ -430,15 +513,15 @@ class ContentRestriction(ApiModel):
     operation: Optional[str] = None
     restrictions: Optional["Restrictions"] = None
     content: Optional[Content] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class ContentRestrictions(ApiModel):
 
     read: Optional[ContentRestriction] = None
     update: Optional[ContentRestriction] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class Restrictions(ApiModel):
@@ -462,8 +545,8 @@ class ContentHistory(ApiModel):
     previousVersion: Optional["Version"] = None
     contributors: Optional[Contributors] = None
     nextVersion: Optional["Version"] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class Business(ApiModel):
@@ -501,15 +584,15 @@ class User(ApiModel):
     operations: Optional[OperationCheckResult] = None
     details: Optional[UserDetails] = None
     personalSpace: Optional[Space] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict]
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]]
 
 
 class UsersUserKeys(ApiModel):
 
     users: Optional[List[User]] = None
     userKeys: Optional[List[str]] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class UserArray(ApiModel):
@@ -524,7 +607,7 @@ class Group(ApiModel):
 
     type: Optional[str] = None
     name: Optional[str] = None
-    _links: Optional[DotDict] = None
+    _links: Optional[Dict[str, Any]] = None
 
 
 class GroupArray(ApiModel):
@@ -545,5 +628,5 @@ class Version(ApiModel):
     minorEdit: Optional[bool] = None
     content: Optional[Content] = None
     collaborators: Optional[UsersUserKeys] = None
-    _expandable: Optional[DotDict] = None
-    _links: Optional[DotDict] = None
+    _expandable: Optional[Dict[str, Any]] = None
+    _links: Optional[Dict[str, Any]] = None
@@ -1,7 +1,9 @@
 import json
-from collections.abc import Mapping, Iterable
+import sys
 from typing import (
     get_type_hints,
+    Callable,
+    Dict,
     get_origin,
     get_args,
     Type,
@@ -18,12 +20,19 @@ from junction.confluence.models.subclassing import get_matching_subclass
 
 
 NoneType = type(None)
+# types json.loads produces as is, which need no marshaling at all
+PRIMITIVE_TYPES = frozenset((str, int, float, bool))
+# string fields drawn from a tiny vocabulary ("page", "current", "storage", ...) that repeat on every item of a
+# response; their values are interned so all those items share one copy of each string
+INTERNED_FIELDS = frozenset(
+    ("type", "status", "representation", "operation", "targetType", "accountType")
+)
 
 
 class ApiEncoder(json.JSONEncoder):
     """A JSON encoder that pairs well with ApiModel.  Uses the "default" encoder unless the object
     implements an encode_json method.  If so, the object returned by encode_json is encoded instead.
-    In most cases this is just self.__dict__.
+    In most cases this is just the attributes that were assigned on the model.
     """
 
     def default(self, obj: Any) -> Any:
@@ -36,6 +45,165 @@ class ApiEncoder(json.JSONEncoder):
 T = TypeVar("T", bound=ApiModel)
 
 
+def _as_dot_dict(value: Any) -> Any:
+    # json.loads only ever produces exact dicts and lists, so type identity checks are enough (and far cheaper
+    # than isinstance checks against the collections.abc ABCs)
+    return DotDict(value) if type(value) is dict else value
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+# marshaling functions are built once per type hint/class and shared by every decoder
+DECODERS_BY_HINT: Dict[Any, Callable[[Any], Any]] = {}
+DECODERS_BY_CLASS: Dict[Type[ApiModel], Callable[[dict], ApiModel]] = {}
+DECODERS_BY_TARGET: Dict[Type[ApiModel], Callable[[Any], Any]] = {}
+
+
+def _build_hinted_decoder(hint: Any) -> Callable[[Any], Any]:
+    """Builds a function that marshals a raw JSON value into the type described by a type hint.  The type hint
+    is only inspected once, and the resulting function is cached, so decoding many values against the same
+    hint pays none of the reflection cost.
+
+    Arguments:
+        hint {Any} -- A type hint from an ApiModel.
+
+    Returns:
+        Callable[[Any], Any] -- A function that accepts a raw JSON value and returns its marshaled form.
+    """
+    if hint not in DECODERS_BY_HINT:
+        DECODERS_BY_HINT[hint] = _compile_hinted_decoder(hint)
+    return DECODERS_BY_HINT[hint]
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    if get_origin(hint) is Union and (hint_args := get_args(hint))[1] is NoneType:
+        # this is an Optional[T]..unwrap the real type:
+        return hint_args[0]
+    return hint
+
+
+def _compile_hinted_decoder(hint: Any) -> Callable[[Any], Any]:
+    unwrapped = _unwrap_optional(hint)
+    if unwrapped is not hint:
+        hint = unwrapped
+    elif hasattr(hint, "__bound__"):
+        # this is a TypeVar (probably from a generic), fetch the type binding information
+        hint = hint.__bound__
+
+    if get_origin(hint) is list:
+        item_decoder = _build_hinted_decoder(get_args(hint)[0])
+
+        def decode_list(value: Any) -> Any:
+            if type(value) is list:
+                return [item_decoder(x) for x in value]
+            return _as_dot_dict(value)
+
+        return decode_list
+    elif get_origin(hint) is dict:
+        # a plain mapping (e.g. _links); json.loads already produced exactly that
+        return _as_is
+    elif isinstance(hint, type) and issubclass(hint, ApiModel):
+        return _build_decoder(hint)
+    else:
+        # don't know what this is or don't support it so
+        # just bring it back as a dotdict and we might get
+        # lucky
+        return _as_dot_dict
+
+
+def _build_class_decoder(klass: Type[ApiModel]) -> Callable[[dict], ApiModel]:
+    """Builds a function that marshals a raw JSON object into exactly klass (no subclass discrimination).
+    Every attribute of klass gets a precomputed decoder based on its type hint; attributes without type hints
+    are brought back as DotDict's and keys that are not attributes of klass are dropped.
+
+    Arguments:
+        klass {Type[ApiModel]} -- The ApiModel class to marshal into.
+
+    Returns:
+        Callable[[dict], ApiModel] -- A function that accepts a raw JSON object and returns an instance of klass.
+    """
+    if klass not in DECODERS_BY_CLASS:
+        DECODERS_BY_CLASS[klass] = _compile_class_decoder(klass)
+    return DECODERS_BY_CLASS[klass]
+
+
+def _compile_class_decoder(klass: Type[ApiModel]) -> Callable[[dict], ApiModel]:
+    hints = get_type_hints(klass)
+    # fields hinted as JSON primitives are assigned exactly as json.loads produced them; only the rest need a
+    # marshaling function
+    plain_fields = frozenset(
+        name
+        for name in klass.__known_fields__
+        if _unwrap_optional(hints.get(name)) in PRIMITIVE_TYPES
+    )
+    interned_fields = frozenset(
+        name
+        for name in plain_fields & INTERNED_FIELDS
+        if _unwrap_optional(hints[name]) is str
+    )
+    field_decoders = {
+        name: (
+            _build_hinted_decoder(hints[name])
+            if name in hints
+            else cast(Callable[[Any], Any], _as_dot_dict)
+        )
+        for name in klass.__known_fields__ - plain_fields
+    }
+
+    # every field assignment below is already known to be valid, so skip __init__ (and its kwargs
+    # validation) and allocate the bare instance directly
+    allocate = klass.__new__
+
+    def decode_class(raw: dict) -> ApiModel:
+        new_obj = allocate(klass)
+        for key, value in raw.items():
+            if key in plain_fields:
+                if key in interned_fields and type(value) is str:
+                    value = sys.intern(value)
+                setattr(new_obj, key, value)
+            else:
+                field_decoder = field_decoders.get(key)
+                if field_decoder is not None:
+                    setattr(new_obj, key, field_decoder(value))
+        return new_obj
+
+    return decode_class
+
+
+def _build_decoder(klass: Any) -> Callable[[Any], Any]:
+    """Builds a function that marshals a raw JSON object into klass, or whichever of its subclasses matches
+    the JSON per their @discriminator's.
+
+    Arguments:
+        klass {Any} -- The ApiModel class (or generic alias of an ApiModel class) to marshal into.
+
+    Returns:
+        Callable[[Any], Any] -- A function that accepts a raw JSON value and returns the marshaled object.
+    """
+    target_klass = cast(
+        Type[ApiModel],
+        (
+            get_origin(klass)
+            if get_origin(klass) and issubclass(cast(type, get_origin(klass)), ApiModel)
+            else klass
+        ),
+    )  # unwrap Generics
+
+    # every parameterization of a generic model (ContentArray[Content], ContentArray[ContentPage], ...) decodes
+    # the same way, so they all share the function built for the unwrapped class
+    if target_klass not in DECODERS_BY_TARGET:
+
+        def decode(raw: Any) -> Any:
+            if type(raw) is not dict:
+                return raw
+            return _build_class_decoder(get_matching_subclass(target_klass, raw))(raw)
+
+        DECODERS_BY_TARGET[target_klass] = decode
+    return DECODERS_BY_TARGET[target_klass]
+
+
 class ApiDecoder(Generic[T]):
     def __init__(self, root_klass: Type[T]):
         """A JSON decoder that pairs well with a particular ApiModel.  The resulting decoder can
@@ -45,6 +213,9 @@ class ApiDecoder(Generic[T]):
         any types it does not understand or members without type hints, it will deserialize them as DotDict's to maintain
         dot accessor compatibility for all members.
 
+        Type hints are only inspected the first time a class is decoded; the marshaling functions built from them are
+        shared by every decoder.
+
         Arguments:
             root_klass {type} -- The type we expect to be decoding with this decoder.
 
@@ -52,8 +223,9 @@ class ApiDecoder(Generic[T]):
             An instance of a custom decoder class that works with this particular type.
         """
         self.root_klass = root_klass
+        self._decoder = _build_decoder(root_klass)
 
-    def decode(self, s: str) -> T:
+    def decode(self, s: Union[str, bytes]) -> T:
         """Decodes a given JSON blob (encoded as a string) into a particular class.  Does this by first
         reading the entire JSON blob into  dictionary and then recursively marshaling the members to the
         appropriate classes by using the type hints on the target class.
@@ -61,59 +233,9 @@ class ApiDecoder(Generic[T]):
         Only supports type hints that are ApiModel subclasses, non-collection primitives, and List[T] of the above.
 
         Arguments:
-            s {str} -- A JSON object encoded as a string.
+            s {Union[str, bytes]} -- A JSON object encoded as a string (or UTF-8/16/32 bytes).
 
         Returns:
             An instance of root_klass with members filled in and strongly typed based on type hints.
         """
-        raw_dict = json.loads(s)
-        return self.__marshal_to_class(raw_dict, self.root_klass)
-
-    def __marshal_to_class(self, dict: dict, klass: Type[ApiModel]) -> T:
-        target_klass = cast(
-            Type[ApiModel],
-            (
-                get_origin(klass)
-                if get_origin(klass)
-                and issubclass(cast(type, get_origin(klass)), ApiModel)
-                else klass
-            ),
-        )  # unwrap Generics
-        new_obj = get_matching_subclass(target_klass, dict)()
-        hints = get_type_hints(target_klass)
-        for key, value in dict.items():
-            if hasattr(new_obj, key):
-                if key not in hints:
-                    setattr(
-                        new_obj,
-                        key,
-                        (
-                            value
-                            if not issubclass(value.__class__, Mapping)
-                            else DotDict(value)
-                        ),
-                    )
-                else:
-                    setattr(
-                        new_obj, key, self.__marshal_hinted_class(value, hints[key])
-                    )
-        return new_obj
-
-    def __marshal_hinted_class(self, value: Any, hint: Any) -> Any:
-        if get_origin(hint) is Union and (hint_args := get_args(hint))[1] is NoneType:
-            # this is an Optional[T]..unwrap the real type:
-            hint = hint_args[0]
-        elif hasattr(hint, "__bound__"):
-            # this is a TypeVar (probably from a generic), fetch the type binding information
-            hint = hint.__bound__
-
-        if get_origin(hint) is list and issubclass(value.__class__, Iterable):
-            list_item_hint = get_args(hint)[0]
-            return [self.__marshal_hinted_class(x, list_item_hint) for x in value]
-        elif isinstance(hint, type) and issubclass(hint, ApiModel):
-            return self.__marshal_to_class(value, hint)
-        else:
-            # don't know what this is or don't support it so
-            # just bring it back as a dotdict and we might get
-            # lucky
-            return DotDict(value) if issubclass(value.__class__, Mapping) else value
+        return cast(T, self._decoder(json.loads(s)))
@@ -1,6 +1,10 @@
-from typing import Callable, List
+from typing import Any, Callable, Dict, List, Tuple, Union
 
-DISCRIMINATORS_BY_CLASS = {}
+DISCRIMINATORS_BY_CLASS: Dict[type, Callable[[dict], bool]] = {}
+# the (key, value) pair of every discriminator declared as one, rather than as an arbitrary matcher
+KEYED_DISCRIMINATORS_BY_CLASS: Dict[type, Tuple[str, Any]] = {}
+# the function get_matching_subclass uses for each class it has searched; reset whenever a discriminator is added
+MATCHERS_BY_CLASS: Dict[type, Callable[[dict], type]] = {}
 
 
 def get_all_subclasses(klass: type) -> List[type]:
@@ -12,34 +16,95 @@ def get_all_subclasses(klass: type) -> List[type]:
     Returns:
         List[Type] -- All classes that are descendants of klass.
     """
-    all_subclasses = []
+    all_subclasses: List[type] = []
 
-    for subclass in klass.__subclasses__():
+    # depth first, each class followed by its own descendants; the stack holds siblings in reverse so they pop
+    # off in declaration order
+    stack: List[type] = klass.__subclasses__()[::-1]
+    while stack:
+        subclass = stack.pop()
         all_subclasses.append(subclass)
-        all_subclasses.extend(get_all_subclasses(subclass))
+        stack.extend(subclass.__subclasses__()[::-1])
 
     return all_subclasses
 
 
-def discriminator(matcher: Callable[[dict], bool]) -> Callable[[type], type]:
+def discriminator(
+    matcher: Union[Callable[[dict], bool], Tuple[str, Any]]
+) -> Callable[[type], type]:
     """Decorator that marks a subclass with how to discriminate it from other
     subclasses.  The discriminators are actually stored in the subclassing module and looked up
     by class via get_matching_subclass.
 
+    Prefer a (key, value) pair over a function wherever possible; when every discriminator in a hierarchy is
+    a pair on the same key, matching is a single dictionary lookup rather than a call per subclass.
+
     Arguments:
-        matcher {Callable[[dict], bool]} -- A function that accepts the raw JSON blob and will return true if the annotated class matches.
+        matcher {Union[Callable[[dict], bool], Tuple[str, Any]]} -- A function that accepts the raw JSON blob and will return true if the annotated class matches, or a (key, value) pair that matches when the raw JSON blob has that value for that key.
 
     Returns:
         Callable[[type], type] -- Decorator function that records the discriminator but otherwise does not modify the annotated class at all.
     """
 
     def discriminator_decorator(klass: type) -> type:
-        DISCRIMINATORS_BY_CLASS[klass] = matcher
+        if isinstance(matcher, tuple):
+            key, value = matcher
+            KEYED_DISCRIMINATORS_BY_CLASS[klass] = matcher
+            DISCRIMINATORS_BY_CLASS[klass] = lambda json: json.get(key) == value
+        else:
+            DISCRIMINATORS_BY_CLASS[klass] = matcher
+        MATCHERS_BY_CLASS.clear()
         return klass
 
     return discriminator_decorator
 
 
+def _compile_matcher(klass: type) -> Callable[[dict], type]:
+    # more deeply nested classes are at the end of the list, so we reverse
+    # the search for a candidate that way the "most specific" class that matches will get
+    # caught first and used instead of a more generic intermediate class.
+    candidates = [
+        candidate
+        for candidate in reversed(get_all_subclasses(klass))
+        if candidate in DISCRIMINATORS_BY_CLASS
+    ]
+
+    if not candidates:
+        return lambda raw_json_dict: klass
+
+    keys = {
+        KEYED_DISCRIMINATORS_BY_CLASS.get(candidate, (None,))[0]
+        for candidate in candidates
+    }
+    if len(keys) == 1 and None not in keys:
+        (key,) = keys
+        subclasses_by_value: Dict[Any, type] = {}
+        for candidate in candidates:
+            subclasses_by_value.setdefault(
+                KEYED_DISCRIMINATORS_BY_CLASS[candidate][1], candidate
+            )
+
+        def match_by_value(raw_json_dict: dict) -> type:
+            try:
+                return subclasses_by_value.get(raw_json_dict.get(key), klass)
+            except TypeError:  # unhashable value, which can't be any discriminator's
+                return klass
+
+        return match_by_value
+
+    matchers = [
+        (candidate, DISCRIMINATORS_BY_CLASS[candidate]) for candidate in candidates
+    ]
+
+    def match_by_scan(raw_json_dict: dict) -> type:
+        for candidate, matches in matchers:
+            if matches(raw_json_dict):
+                return candidate
+        return klass
+
+    return match_by_scan
+
+
 def get_matching_subclass(klass: type, raw_json_dict: dict) -> type:
     """Finds the subclass of klass that matches the provided raw JSON by looking for
     and checking any registered discriminators (using the @discriminator annotation).
@@ -49,6 +114,8 @@ def get_matching_subclass(klass: type, raw_json_dict: dict) -> type:
 
     If multiple discriminators match across the entire class hierarchy, the behavior is undefined.
 
+    The subclasses of klass are only searched for discriminators the first time it is matched against.
+
     Arguments:
         klass {type} -- A class whose subclasses will be searched for a match.
         raw_json_dict {dict} -- JSON object decoded into a dictionary (usually via json.loads)
@@ -56,12 +123,7 @@ def get_matching_subclass(klass: type, raw_json_dict: dict) -> type:
     Returns:
         type -- The most derived class with a matching discriminator; this ends up being klass if no subclasses match at all.
     """
-    # more deeply nested classes are at the end of the list, so we reverse
-    # the search for a candidate that way the "most specific" class that matches will get
-    # caught first and used instead of a more generic intermediate class.
-    for candidate in reversed(get_all_subclasses(klass)):
-        if candidate in DISCRIMINATORS_BY_CLASS:
-            if DISCRIMINATORS_BY_CLASS[candidate](raw_json_dict):
-                return candidate
-
-    return klass
+    matcher = MATCHERS_BY_CLASS.get(klass)
+    if matcher is None:
+        matcher = MATCHERS_BY_CLASS[klass] = _compile_matcher(klass)
+    return matcher(raw_json_dict)
@@ -17,6 +17,9 @@ The Delta API breaks up modifications into several different actions and execute
     * Finishing Page Moves, by moving them to their final destinations with the desired name (and making any index pages that do not already exist)
     * Page Updates
 
+Each step completes before the next begins.  Within a step, actions that touch unrelated top level pages (and their
+descendants) may be executed concurrently.
+
 This ordering was chosen very specifically, along with the choice to split page moves in this seemingly peculiar way, to deal with various potential edge cases
 that can occur based on the type of modifications, some examples:
     * A Page "A.md" gets moved into a folder with the same name and gets a new name "A/Foobar.md"
@@ -27,8 +30,25 @@ way to replicate that procedure.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Iterable, Any
-from uuid import uuid4
+from concurrent.futures import Executor, wait, FIRST_EXCEPTION
+from functools import partial
+from itertools import count
+from typing import (
+    List,
+    Iterable,
+    Any,
+    Optional,
+    Set,
+    Union,
+    Callable,
+    Dict,
+    Sequence,
+    Tuple,
+    cast,
+)
+from secrets import token_hex
+
+from requests import HTTPError
 
 from junction.markdown import markdown_to_storage
 from junction.confluence import Confluence
@@ -41,19 +61,42 @@ from junction.confluence.models import (
     Content,
     ContentArray,
     ContentPage,
-    Version,
+    UpdateVersion,
 )
 from junction.git import Modification, ModificationType
-from junction.util import for_all, JunctionError
+from junction.util import JunctionError
 
 
 logger = logging.getLogger(__name__)
 
 
+# a page body in Confluence storage representation, or a function that produces it the first time it is needed
+PageBody = Union[str, Callable[[], str]]
+
+
 class DeltaError(JunctionError):
     pass
 
 
+# Confluence has no error code for a duplicate title; its JSON error body only gives the reason in the message field
+DUPLICATE_TITLE_MESSAGE = "A page with this title already exists"
+
+
+def _is_duplicate_title(error: HTTPError) -> bool:
+    """Whether Confluence refused to create a page because a page with the same title already exists in the space."""
+    if error.response is None or error.response.status_code != 400:
+        return False
+    try:
+        details = error.response.json()
+    except ValueError:
+        return False
+    return (
+        isinstance(details, dict)
+        and details.get("statusCode") == 400
+        and DUPLICATE_TITLE_MESSAGE in str(details.get("message", ""))
+    )
+
+
 class PageAction(ABC):
     """Base class for all actions against individual pages.  A page action should target an individual page in Confluence,
     though it may also trigger additional actions affecting other pages as needed to successfully complete the requested action,
@@ -64,16 +107,47 @@ class PageAction(ABC):
     if index pages were made explicit (via the git/Modification API) rather than implicit as needed by a particular page action.
     """
 
+    # a delta can hold an action for every file in the repository, so keep them small
+    __slots__ = ("title", "ancestor_titles", "_new_body", "scope")
+
+    # what fetch_target_page expands on the targeted page
+    TARGET_PAGE_EXPAND = "version,ancestors,childTypes.page"
+
     def __init__(self, title: str):
         self.title = title
+        # parents of the targeted page from root to leaf (excluding the space homepage), and the body to write to
+        # the targeted page, for actions that use them
+        self.ancestor_titles: Sequence[str] = ()
+        self._new_body: Optional[PageBody] = None
+        # top level pages (i.e. children of the space homepage) this action may read or write; actions with
+        # disjoint scopes do not interfere with each other and can be executed concurrently
+        self.scope: Set[str] = {title}
 
     @abstractmethod
     def execute(self, api_client: Confluence) -> Any:
         pass
 
+    @property
+    def new_body(self) -> Optional[str]:
+        """The body to write to the targeted page, if any; converted (once) only when first read, so that
+        actions which never get executed, e.g. in a dry run, never pay for it."""
+        if callable(self._new_body):
+            self._new_body = self._new_body()
+        return self._new_body
+
+    @new_body.setter
+    def new_body(self, new_body: Optional[PageBody]) -> None:
+        self._new_body = new_body
+
+    @property
+    def lookup_titles(self) -> Set[str]:
+        """The titles of the pages this action (and the actions it triggers) will fetch, as far as can be known
+        before executing it."""
+        return {self.title, *self.ancestor_titles}
+
     def fetch_target_page(self, api_client: Confluence) -> ContentArray[ContentPage]:
         query = api_client.content.get_page(
-            title=self.title, expand="version,ancestors,childTypes.page"
+            title=self.title, expand=self.TARGET_PAGE_EXPAND
         )
         if query.size and query.size > 1:
             raise RuntimeError(
@@ -83,10 +157,18 @@ class PageAction(ABC):
 
 
 class MovePage(PageAction):
-    """Move a page to under a different parent, or to a different name, or both simultaneously.  Although Confluence supports it,
-    you cannot change th content of the page while executing a move."""
-
-    def __init__(self, title: str, new_title: str, ancestor_titles: List[str] = []):
+    """Move a page to under a different parent, or to a different name, or both simultaneously.  The content of the page
+    can optionally be replaced as part of the same move."""
+
+    __slots__ = ("new_title",)
+
+    def __init__(
+        self,
+        title: str,
+        new_title: str,
+        ancestor_titles: Sequence[str] = (),
+        new_body: Optional[PageBody] = None,
+    ):
         """Initializes an instance of MovePage.
 
         Arguments:
@@ -94,11 +176,18 @@ class MovePage(PageAction):
             new_title {str} -- The new title of the page (can be the same as the old title if you just want to change the parent).
 
         Keyword Arguments:
-            ancestor_titles {List[str]} -- The names of the parents to move the page under from root to leaf, excluding the space homepage. (default: {[]})
+            ancestor_titles {Sequence[str]} -- The names of the parents to move the page under from root to leaf, excluding the space homepage. (default: {()})
+            new_body {Optional[PageBody]} -- If specified, the body to assign to the page in the same update that moves it.  Should be in
+                                             Confluence storage representation (or a function producing it).  (default: {None})
         """
         super().__init__(title)
         self.new_title = new_title
-        self.ancestor_titles = ancestor_titles if ancestor_titles else []
+        self.ancestor_titles = tuple(ancestor_titles)
+        self.new_body = new_body
+        self.scope = {
+            title,
+            self.ancestor_titles[0] if self.ancestor_titles else new_title,
+        }
 
     def execute(self, api_client: Confluence) -> None:
         """Moves a page by (optionally) changing its title and (optionally) changing its parent.  If the targeted page does not
@@ -132,6 +221,11 @@ class MovePage(PageAction):
                     self.title,
                     self.new_title,
                 )
+                if self.new_body is not None:
+                    # ...but the content may not have been, if the move was done in a separate update
+                    UpdatePage(
+                        self.new_title, self.new_body, self.ancestor_titles
+                    ).execute(api_client)
                 return
             else:
                 raise RuntimeError(f"No page found with title {self.title} to move.")
@@ -147,7 +241,7 @@ class MovePage(PageAction):
             update_request = UpdateContent(
                 title=self.new_title,
                 type="page",
-                version=Version(
+                version=UpdateVersion(
                     number=(
                         old_page.version.number + 1
                         if old_page.version and old_page.version.number
@@ -155,20 +249,29 @@ class MovePage(PageAction):
                     )
                 ),
                 ancestors=[Content(id=parent.id)] if parent else None,
+                body=(
+                    Body(
+                        storage=ContentBody(
+                            value=self.new_body, representation="storage"
+                        )
+                    )
+                    if self.new_body is not None
+                    else None
+                ),
             )
 
             if old_page.id:
-                logger.info(
-                    "Moving %s to %s.",
-                    (
-                        [x.title for x in old_page.ancestors[1:]]
-                        if old_page.ancestors
-                        else []
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Moving %s to %s.",
+                        (
+                            [x.title for x in old_page.ancestors[1:]]
+                            if old_page.ancestors
+                            else []
+                        )
+                        + [self.title],
+                        [*self.ancestor_titles, self.new_title],
                     )
-                    + [self.title],
-                    (self.ancestor_titles if self.ancestor_titles else [])
-                    + [self.new_title],
-                )
                 api_client.content.update_content(old_page.id, update_request)
             else:
                 raise JunctionError(
@@ -183,19 +286,38 @@ class MovePage(PageAction):
 class CreatePage(PageAction):
     """Create a new page under a particular parent (or the space homepage if no parents specified)"""
 
-    def __init__(self, title: str, new_body: str, ancestor_titles: List[str] = []):
+    __slots__ = ("assume_missing",)
+
+    def __init__(
+        self,
+        title: str,
+        new_body: PageBody,
+        ancestor_titles: Sequence[str] = (),
+        assume_missing: bool = False,
+    ):
         """Initializes an instance of CreatePage.
 
         Arguments:
             title {str} -- The title of the page to create.
-            new_body {str} -- The body of the new page in Confluence storage representation.
+            new_body {PageBody} -- The body of the new page in Confluence storage representation (or a function producing it).
 
         Keyword Arguments:
-            ancestor_titles {List[str]} -- The names of the parents of the new page from root to leaf, excluding the space homepage. (default: {[]})
+            ancestor_titles {Sequence[str]} -- The names of the parents of the new page from root to leaf, excluding the space homepage. (default: {()})
+            assume_missing {bool} -- Create the page without looking it up first, and only switch to updating it if Confluence
+                                     refuses the create because the title is taken.  Saves a request per page when the page
+                                     usually doesn't exist yet. (default: {False})
         """
         super().__init__(title)
         self.new_body = new_body
-        self.ancestor_titles = ancestor_titles if ancestor_titles else []
+        self.ancestor_titles = tuple(ancestor_titles)
+        self.assume_missing = assume_missing
+        self.scope = {self.ancestor_titles[0] if self.ancestor_titles else title}
+
+    @property
+    def lookup_titles(self) -> Set[str]:
+        return (
+            set(self.ancestor_titles) if self.assume_missing else super().lookup_titles
+        )
 
     def execute(self, api_client: Confluence) -> Content:
         """Creates a brand new page under a particular parent.  If no parents are specified, Confluence makes the page under the space homepage.
@@ -211,15 +333,9 @@ class CreatePage(PageAction):
             Content -- The created page.
         """
 
-        query = self.fetch_target_page(api_client)
-        if query.size == 1:
-            logger.info(
-                "Trying to create %s but it already exists, updating instead.",
-                self.title,
-            )
-            return UpdatePage(self.title, self.new_body, self.ancestor_titles).execute(
-                api_client
-            )
+        query = None if self.assume_missing else self.fetch_target_page(api_client)
+        if query is not None and query.size == 1:
+            return self.__update_instead(api_client)
         else:  # query.size == 0
             parent = (
                 EnsureAncestors(self.ancestor_titles).execute(api_client)
@@ -237,25 +353,52 @@ class CreatePage(PageAction):
                 ),
             )
 
-            logger.info(
-                "Creating %s",
-                (self.ancestor_titles if self.ancestor_titles else []) + [self.title],
-            )
-            return api_client.content.create_content(create_request)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Creating %s",
+                    [*self.ancestor_titles, self.title],
+                )
+            try:
+                # a replayed add finds its page already there, which is handled below rather than reported
+                return api_client.content.create_content(
+                    create_request,
+                    expected_statuses=(400,) if self.assume_missing else (),
+                )
+            except HTTPError as ex:
+                if self.assume_missing and ex.response is not None:
+                    if _is_duplicate_title(ex):
+                        return self.__update_instead(api_client)
+                    logger.error(
+                        "Confluence API failure response %s: %s",
+                        ex.response.status_code,
+                        ex.response.text,
+                    )
+                raise
+
+    def __update_instead(self, api_client: Confluence) -> Content:
+        logger.info(
+            "Trying to create %s but it already exists, updating instead.",
+            self.title,
+        )
+        return UpdatePage(
+            self.title, cast(str, self.new_body), self.ancestor_titles
+        ).execute(api_client)
 
 
 class EnsureAncestors(CreatePage):
     """Creates index pages (which correspond to folders in the file system) recursively ensuring all parents up to the root (space homepage) exist."""
 
+    __slots__ = ()
+
     PAGE_BODY_LIST_CHILDREN = '<p><ac:structured-macro ac:name="children" ac:schema-version="2" ac:macro-id="92c7a2c4-5cca-4ecf-81a2-946ef7388c71" /></p>'
 
-    def __init__(self, ancestor_titles: List[str]):
+    def __init__(self, ancestor_titles: Sequence[str]):
         """Initializes an instance of EnsureAncestors.  This class should not be used for pages with no parents AKA pages
         whose parent is the space homepage.  The space homepage is assumed to exist and there is no handling for this not being
         the case.
 
         Arguments:
-            ancestor_titles {List[str]} -- The names of each parent page in order, excluding the root (space homepage).
+            ancestor_titles {Sequence[str]} -- The names of each parent page in order, excluding the root (space homepage).
                                            Must not be empty, therefore at least one parent must be specified.
         """
         super().__init__(
@@ -294,21 +437,29 @@ class UpdatePage(PageAction):
     """Updates the content of a page.  Cannot move (change the title or parent) of a page even though Confluence supports this.  Use
     MovePage if you want to do that."""
 
-    def __init__(self, title: str, new_body: str, ancestor_titles: List[str] = []):
+    __slots__ = ()
+
+    def __init__(
+        self,
+        title: str,
+        new_body: PageBody,
+        ancestor_titles: Sequence[str] = (),
+    ):
         """Initializes an instance of UpdatePage.  This class should not be used for moving a page, it is only for changing the content
         of an existing page.
 
         Arguments:
             title {str} -- The title of the page to update.
-            new_body {str} -- The body to assign to the page.  Should be in Confluence storage representation.
+            new_body {PageBody} -- The body to assign to the page.  Should be in Confluence storage representation (or a function producing it).
 
         Keyword Arguments:
-            ancestor_titles {List[str]} -- The parents of the targeted page from root to leaf (excluding space homepage).
-                                           Must match current parents in Confluence (default: {[]})
+            ancestor_titles {Sequence[str]} -- The parents of the targeted page from root to leaf (excluding space homepage).
+                                           Must match current parents in Confluence (default: {()})
         """
         super().__init__(title)
         self.new_body = new_body
-        self.ancestor_titles = ancestor_titles if ancestor_titles else []
+        self.ancestor_titles = tuple(ancestor_titles)
+        self.scope = {self.ancestor_titles[0] if self.ancestor_titles else title}
 
     def execute(self, api_client: Confluence) -> Content:
         """Updates the content of an already existing page.  If the page does not exist, this operation silently switches to creating
@@ -328,18 +479,20 @@ class UpdatePage(PageAction):
             existing = query.results[0]
             # skip the first ancestor, it's the space home page
             current_ancestors = (
-                [x.title for x in existing.ancestors[1:]] if existing.ancestors else []
+                tuple(x.title for x in existing.ancestors[1:])
+                if existing.ancestors
+                else ()
             )
             assert (
                 self.ancestor_titles == current_ancestors
             ), "Cannot change ancestors with UpdatePage, use MovePage instead.  {} != {}.".format(
-                self.ancestor_titles, current_ancestors
+                list(self.ancestor_titles), list(current_ancestors)
             )
 
             update_request = UpdateContent(
                 title=self.title,
                 type="page",
-                version=Version(
+                version=UpdateVersion(
                     number=(
                         existing.version.number + 1
                         if existing.version and existing.version.number
@@ -357,11 +510,29 @@ class UpdatePage(PageAction):
             )
 
             if existing.id:
-                logger.info(
-                    "Updating %s with new content.",
-                    (self.ancestor_titles if self.ancestor_titles else [])
-                    + [self.title],
+                # a PUT always creates a new version, even if nothing changed; checking the current body first
+                # costs a (cheaper) GET but keeps the page history free of empty revisions.  The body is left out
+                # of the title lookup so that the lookup shares its expand (and cache entry) with every other action
+                current = api_client.content.get_page_by_id(
+                    existing.id, query_params={"expand": "body.storage"}
                 )
+                if (
+                    current.body
+                    and current.body.storage
+                    and current.body.storage.value == self.new_body
+                ):
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Skipping update of %s, its content is unchanged.",
+                            [*self.ancestor_titles, self.title],
+                        )
+                    return existing
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Updating %s with new content.",
+                        [*self.ancestor_titles, self.title],
+                    )
                 return api_client.content.update_content(existing.id, update_request)
             else:
                 raise JunctionError(
@@ -372,14 +543,37 @@ class UpdatePage(PageAction):
                 "Trying to update %s but it doesn't exist, creating instead.",
                 self.title,
             )
-            return CreatePage(self.title, self.new_body, self.ancestor_titles).execute(
-                api_client
-            )
+            return CreatePage(
+                self.title, cast(str, self.new_body), self.ancestor_titles
+            ).execute(api_client)
 
 
 class DeletePage(PageAction):
     """Deletes an existing page."""
 
+    __slots__ = ("cleanup_ancestors", "parent_title")
+
+    def __init__(
+        self,
+        title: str,
+        cleanup_ancestors: bool = True,
+        parent_title: Optional[str] = None,
+    ):
+        """Initializes an instance of DeletePage.
+
+        Arguments:
+            title {str} -- The title of the page to delete.
+
+        Keyword Arguments:
+            cleanup_ancestors {bool} -- Whether to clean up the ancestors left without children by the delete.  Disable
+                                        this when a later action deletes a sibling of the page and cleans up instead. (default: {True})
+            parent_title {Optional[str]} -- The title of the expected parent of the page, cleaned up even if the page is
+                                            already gone. (default: {None})
+        """
+        super().__init__(title)
+        self.cleanup_ancestors = cleanup_ancestors
+        self.parent_title = parent_title
+
     def execute(self, api_client: Confluence) -> None:
         """Deletes the page from Confluence.  If the page does not exist then the operation reports success without doing
         anything.  This ensures that the action can be replayed in the event of failure elsewhere in the delta.
@@ -393,17 +587,25 @@ class DeletePage(PageAction):
         if query.size == 0:
             # already gone, don't error
             logger.info("Trying to delete %s but it's already gone.", self.title)
+            if self.cleanup_ancestors and self.parent_title:
+                # earlier deletes of siblings may have left the cleanup of their folder to this one
+                CleanupEmptyAncestors(self.parent_title).execute(api_client)
             return
         else:  # query.size == 1
             page = query.results[0]
             if page.id:
-                logger.info(
-                    "Deleting %s",
-                    ([x.title for x in page.ancestors[1:]] if page.ancestors else [])
-                    + [self.title],
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Deleting %s",
+                        (
+                            [x.title for x in page.ancestors[1:]]
+                            if page.ancestors
+                            else []
+                        )
+                        + [self.title],
+                    )
                 api_client.content.delete_content(page.id)
-            if page.ancestors and page.ancestors[-1].title:
+            if self.cleanup_ancestors and page.ancestors and page.ancestors[-1].title:
                 # try to cleanup any parents as they might now be empty..however skip
                 # this step if there aren't any parents, or only 1 parent (that is always the
                 # space homepage, and we don't want to delete that).
@@ -415,6 +617,8 @@ class CleanupEmptyAncestors(DeletePage):
     """Recursively cleans up ancestor pages that no longer have any children.  Should be used after any operations that may "empty out"
     an ancestor such as a move or a delete."""
 
+    __slots__ = ()
+
     def execute(self, api_client: Confluence) -> None:
         """Removes the page if it has no more child pages.  It uses DeletePage for this operation
         which will end up recursively calling this action.  The result is that ancestors will be
@@ -457,8 +661,13 @@ class Delta(object):
         self.updates: List[PageAction] = []
         self.adds: List[PageAction] = []
         self.finish_renames: List[PageAction] = []
+        # renamed pages are parked under unique temporary titles, made of one random prefix per delta and a counter
+        self._rename_prefix = token_hex(8)
+        self._rename_counter = count()
 
-    def execute(self, api_client: Confluence) -> None:
+    def execute(
+        self, api_client: Confluence, executor: Optional[Executor] = None
+    ) -> None:
         """Executes all of the changes to Confluence that this delta represents.  Operations
         are applied in a very particular order to ensure correctness in as many situations as possible.
         Deltas generically cannot be replayed but some tolerance for this has been added to support re-running
@@ -471,12 +680,80 @@ class Delta(object):
 
         Arguments:
             api_client {Confluence} -- Confluence API client to use for all API actions.
+
+        Keyword Arguments:
+            executor {Optional[Executor]} -- If provided, actions within each phase that touch unrelated parts of the
+                                             page tree are executed concurrently on this executor. (default: {None})
         """
-        for_all(self.deletes, lambda x: x.execute(api_client))
-        for_all(self.start_renames, lambda x: x.execute(api_client))
-        for_all(self.adds, lambda x: x.execute(api_client))
-        for_all(self.finish_renames, lambda x: x.execute(api_client))
-        for_all(self.updates, lambda x: x.execute(api_client))
+        with api_client.content.caching_pages():
+            for phase in (
+                self.deletes,
+                self.start_renames,
+                self.adds,
+                self.finish_renames,
+                self.updates,
+            ):
+                self._execute_phase(phase, api_client, executor)
+
+    @staticmethod
+    def _execute_phase(
+        actions: List[PageAction],
+        api_client: Confluence,
+        executor: Optional[Executor],
+    ) -> None:
+        lookup_titles = {title for action in actions for title in action.lookup_titles}
+        if len(lookup_titles) > 1:
+            # one search for every page the phase is about to look up, instead of a request per page
+            api_client.content.prefetch_pages(
+                lookup_titles, expand=PageAction.TARGET_PAGE_EXPAND
+            )
+
+        lanes = Delta._partition_into_lanes(actions)
+        if executor is None or len(lanes) <= 1:
+            Delta._execute_lane(actions, api_client)
+            return
+
+        futures = [
+            executor.submit(Delta._execute_lane, lane, api_client) for lane in lanes
+        ]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        # let in-flight lanes finish before surfacing an error so the wiki is left in a replayable state
+        wait(not_done)
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+
+    @staticmethod
+    def _execute_lane(actions: List[PageAction], api_client: Confluence) -> None:
+        for action in actions:
+            action.execute(api_client)
+
+    @staticmethod
+    def _partition_into_lanes(actions: List[PageAction]) -> List[List[PageAction]]:
+        """Groups actions into lanes such that no two lanes touch the same part of the page tree.  Actions
+        within a lane keep their relative order and must be executed sequentially; lanes are independent.
+
+        Arguments:
+            actions {List[PageAction]} -- The actions from a single phase of a Delta.
+
+        Returns:
+            List[List[PageAction]] -- Lanes of actions that can be executed concurrently with each other.
+        """
+        lanes: List[Set[int]] = []
+        scopes: List[Set[str]] = []
+        for index, action in enumerate(actions):
+            lane = {index}
+            scope = set(action.scope)
+            for i in reversed(range(len(lanes))):
+                if scopes[i] & scope:
+                    lane |= lanes.pop(i)
+                    scope |= scopes.pop(i)
+            lanes.append(lane)
+            scopes.append(scope)
+
+        return [[actions[i] for i in sorted(lane)] for lane in lanes]
 
     @staticmethod
     def from_modifications(modifications: Iterable[Modification]) -> "Delta":
@@ -494,31 +771,75 @@ class Delta(object):
             Delta -- A ready-to-execute Delta.
         """
         me = Delta()
+        # the last delete so far of a page in each folder
+        deletes_by_folder: Dict[Tuple[str, ...], DeletePage] = {}
         for mod in modifications:
             if not mod.path:
                 continue
 
             title = mod.path.stem
-            ancestors = list(mod.path.parts[:-1])
+            ancestors = mod.path.parts[:-1]
+            scope = {mod.path.parts[0] if ancestors else title}
 
+            # source code is read from git here rather than when the actions run, as git's object database must
+            # not be shared between the threads executing a delta; only the conversion to storage format is deferred
             if mod.change_type == ModificationType.ADD:
+                # on a first run the page is new, so don't spend a request confirming that
                 me.adds.append(
-                    CreatePage(title, markdown_to_storage(mod.source_code), ancestors)
+                    CreatePage(
+                        title,
+                        partial(markdown_to_storage, mod.source_code),
+                        ancestors,
+                        assume_missing=True,
+                    )
                 )
             elif mod.change_type == ModificationType.MODIFY:
                 me.updates.append(
-                    UpdatePage(title, markdown_to_storage(mod.source_code), ancestors)
+                    UpdatePage(
+                        title, partial(markdown_to_storage, mod.source_code), ancestors
+                    )
                 )
             elif mod.change_type == ModificationType.DELETE:
-                me.deletes.append(DeletePage(title))
+                delete = DeletePage(
+                    title, parent_title=ancestors[-1] if ancestors else None
+                )
+                # deletes clean up their (now empty) ancestors.  Deletes from the same folder share a scope and
+                # so run in order in the same lane; only the last of them needs to check whether the folder
+                # emptied out, rather than every one of them probing the same chain of ancestors.  It does so
+                # even if its own page is already gone
+                delete.scope = scope
+                if ancestors:
+                    previous = deletes_by_folder.get(ancestors)
+                    if previous:
+                        previous.cleanup_ancestors = False
+                    deletes_by_folder[ancestors] = delete
+                me.deletes.append(delete)
             elif mod.change_type == ModificationType.RENAME and mod.previous_path:
                 old_title = mod.previous_path.stem
-                temporary_title = f"{uuid4()}_{old_title}"
-                me.start_renames.append(MovePage(old_title, temporary_title))
-                me.finish_renames.append(MovePage(temporary_title, title, ancestors))
-                me.finish_renames.append(
-                    UpdatePage(title, markdown_to_storage(mod.source_code), ancestors)
+                old_scope = {
+                    (
+                        mod.previous_path.parts[0]
+                        if len(mod.previous_path.parts) > 1
+                        else old_title
+                    )
+                }
+                temporary_title = f"junction_tmp_{me._rename_prefix}_{next(me._rename_counter)}_{old_title}"
+                start_rename = MovePage(old_title, temporary_title)
+                start_rename.scope = old_scope
+                # the temporary page still sits under its original parent, so finishing the move
+                # cleans up the old ancestors as well as creating the new ones.  The new content is
+                # written by the same update that moves the page into place, except when moving to the
+                # top level: a move without ancestors leaves the page under its current parent, which
+                # the ancestor check in a separate UpdatePage reports.
+                new_body = partial(markdown_to_storage, mod.source_code)
+                finish_rename = MovePage(
+                    temporary_title, title, ancestors, new_body if ancestors else None
                 )
+                finish_rename.scope = old_scope | scope
+                me.start_renames.append(start_rename)
+                me.finish_renames.append(finish_rename)
+                if not ancestors:
+                    me.finish_renames.append(UpdatePage(title, new_body, ancestors))
             else:
                 raise NotImplementedError(
                     "Cannot process delta for modification type {}".format(
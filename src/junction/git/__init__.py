@@ -1,13 +1,32 @@
 import logging
+from functools import partial
 from pathlib import Path
 from enum import Enum
-from typing import List, Optional, Generator, Union, Iterable
-from git import Repo, Commit, NULL_TREE, Diff, Tree
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Generator,
+    Union,
+    Iterable,
+    Sequence,
+    Set,
+)
+from git import Repo, Commit, NULL_TREE, Diff, GitCommandError
 
 
 logger = logging.getLogger(__name__)
 
 
+# the contents of a modified file, or a function that reads them from git the first time they are needed
+SourceCode = Union[str, bytes, Callable[[], Union[str, bytes]]]
+
+
+def _read_blob(repo: Repo, binsha: bytes) -> bytes:
+    return repo.odb.stream(binsha).read()
+
+
 def find_repository_root(path: Path) -> Optional[Path]:
     """Locates the root of the git repository a given path is located within.  Searches upwards for a folder
     containing a ".git" directory.
@@ -20,25 +39,44 @@ def find_repository_root(path: Path) -> Optional[Path]:
     """
 
     path = path.resolve()
+    for candidate in (path, *path.parents):
+        if candidate.joinpath(".git").exists():
+            logger.debug("Located .git folder under %s.", candidate)
+            return candidate
+
+    # parents ends at the root, so we bottomed out; no repository found
+    logger.debug(
+        "Searched all parent directories until hitting a root and found no .git folder."
+    )
+    return None
 
-    def _find_repository_root(path: Path) -> Optional[Path]:
-        if path.joinpath("./.git").exists():
-            logger.debug("Located .git folder under %s.", path)
-            return path
-        elif path.parent == path:
-            # when at a root, the parent will be the same as path, so we bottomed out; no repository found
-            logger.debug(
-                "Searched all parent directories until hitting a root and found no .git folder."
-            )
-            return None
-        else:
-            return _find_repository_root(path.parent)
 
-    return _find_repository_root(path)
+def write_commit_graph(repo: Repo) -> None:
+    """Writes a commit-graph file with changed-path Bloom filters for the repository.  With these in place git can skip
+    parsing commits that cannot have touched a path when walking history limited to that path, which is most of them
+    for a wiki kept in a subfolder of a large repository.  An existing commit-graph is rewritten, so one written
+    without Bloom filters gains them.
+
+    This writes to the repository (and walks its entire history the first time), so it is only done on request.  The
+    commit-graph is purely a cache, so failure to write it (e.g. on older versions of git) is logged and ignored.
+
+    Arguments:
+        repo {Repo} -- The repository to write the commit-graph for.
+    """
+    try:
+        repo.git.commit_graph("write", "--reachable", "--changed-paths")
+        logger.debug("Wrote commit-graph for %s.", repo.git_dir)
+    except GitCommandError:
+        logger.warning(
+            "Unable to write commit-graph for %s.", repo.git_dir, exc_info=True
+        )
 
 
 def find_commits_on_branch_after(
-    branch_name: str, start_commit_sha: Optional[str], repo: Repo
+    branch_name: str,
+    start_commit_sha: Optional[str],
+    repo: Repo,
+    path: Optional[Path] = None,
 ) -> List[Commit]:
     """Gets a list of commits on a given branch after a particular starting point.  The starting commit
     is NOT included in the result.  The commits will be ordered chronologically from oldest to newest.
@@ -50,6 +88,10 @@ def find_commits_on_branch_after(
         start_commit_sha {str} -- The commit hash to start from or None if the entire branch history should be included.
         repo {Repo} -- The repository to sample commits from.
 
+    Keyword Arguments:
+        path {Optional[Path]} -- If set, only commits that modify something under this path (relative to the root of
+                                 the repository) are included. (default: {None})
+
     Returns:
         List[Commit] -- A generator that returns commits after start_commit_sha in chronological order up to the HEAD of branch_name
     """
@@ -59,9 +101,12 @@ def find_commits_on_branch_after(
         if start_commit_sha is None
         else f"{start_commit_sha}..{branch_name}"
     )
-    reverse_chronological_commits = list(repo.iter_commits(rev, first_parent=True))
-    reverse_chronological_commits.reverse()
-    return reverse_chronological_commits
+    # git lists the commits oldest first and GitPython only hydrates them when their details are first read
+    return list(
+        repo.iter_commits(
+            rev, paths=str(path) if path else "", first_parent=True, reverse=True
+        )
+    )
 
 
 class ModificationType(Enum):
@@ -72,16 +117,28 @@ class ModificationType(Enum):
     UNKNOWN = 5
 
 
+# git's one letter status codes, as found in raw diff output and on Diff.change_type
+MODIFICATION_TYPES_BY_STATUS = {
+    "A": ModificationType.ADD,
+    "D": ModificationType.DELETE,
+    "R": ModificationType.RENAME,
+    "M": ModificationType.MODIFY,
+    "T": ModificationType.MODIFY,
+}
+
+
 class Modification:
     """Represents a modification to the filesystem.  This is used to abstract the details of git from other subsystems that consume information
     about changes such as the Delta API."""
 
+    __slots__ = ("_old_path", "_new_path", "change_type", "_source_code")
+
     def __init__(
         self,
         old_path: Optional[Union[str, Path]],
         new_path: Optional[Union[str, Path]],
         change_type: ModificationType,
-        source_code: Optional[str] = None,
+        source_code: Optional[SourceCode] = None,
     ):
         """Initializes an instance of Modification.
 
@@ -91,12 +148,21 @@ class Modification:
             change_type {ModificationType} -- The modification made to this file.
 
         Keyword Arguments:
-            source_code {Optional[str]} -- The contents of the file after the modification; should only be None for deletes (default: {None}).
+            source_code {Optional[SourceCode]} -- The contents of the file after the modification, or a function reading them; should
+                                                 only be None for deletes (default: {None}).
         """
         self._old_path = Path(old_path) if old_path is not None else None
         self._new_path = Path(new_path) if new_path is not None else None
         self.change_type = change_type
-        self.source_code = source_code
+        self._source_code = source_code
+
+    @property
+    def source_code(self) -> Optional[Union[str, bytes]]:
+        """The contents of the file after the modification.  Read (once) only when first needed, so modifications that
+        get filtered out never load their file from git."""
+        if callable(self._source_code):
+            self._source_code = self._source_code()
+        return self._source_code
 
     @property
     def previous_path(self) -> Optional[Path]:
@@ -116,6 +182,12 @@ class Modification:
         Returns:
             ModificationType -- Add if a new file is committed; delete if a file is removed; rename if a file is moved; and modify otherwise.
         """
+        # diffs parsed from raw output (the default) carry git's status letter; only patch diffs lack it
+        if diff.change_type:
+            return MODIFICATION_TYPES_BY_STATUS.get(
+                diff.change_type, ModificationType.UNKNOWN
+            )
+
         if diff.new_file:
             return ModificationType.ADD
         if diff.deleted_file:
@@ -128,63 +200,134 @@ class Modification:
         return ModificationType.UNKNOWN
 
     @staticmethod
-    def from_diff(diff: Diff, tree: Tree) -> "Modification":
-        """Builds a modification out of a diff and the tree of the commit.
+    def from_diff(diff: Diff) -> "Modification":
+        """Builds a modification out of a diff.
 
         Arguments:
             diff {Diff} -- a Diff to inspect
-            tree {Tree} -- the Tree of the commit this diff comes from, used to extract source code
 
         Returns:
             Modification -- A modification representing the provided diff.
         """
-        old_path = diff.a_path
-        new_path = diff.b_path
         change_type = Modification._determine_modification_type(diff)
 
-        tree_path = new_path if new_path else old_path
+        # the diff already names the blob after the change, so there's no need to look the path up in the tree
+        blob = diff.b_blob if change_type != ModificationType.DELETE else None
 
-        source_code = (
-            tree[
-                (
-                    tree_path
-                    if tree_path
-                    else "this should not be possible make mypy happy"
-                )
-            ].data_stream.read()
-            if change_type != ModificationType.DELETE
-            else None
-        )
-
-        mod = Modification(old_path, new_path, change_type, source_code)
-        logger.debug(
-            "%s, with %s bytes of source code.",
-            mod,
-            len(source_code) if source_code else 0,
+        mod = Modification(
+            diff.a_path,
+            diff.b_path,
+            change_type,
+            partial(_read_blob, blob.repo, blob.binsha) if blob else None,
         )
+        logger.debug("%s, with %s bytes of source code.", mod, blob.size if blob else 0)
         return mod
 
     def __repr__(self) -> str:
         return f"{self.change_type} {self.path}"
 
 
-def get_modifications(commit: Commit) -> List[Modification]:
+def get_modifications(
+    commit: Commit, path: Optional[Path] = None
+) -> List[Modification]:
     """Extracts all the modifications from a given commit.
 
     Arguments:
         commit {Commit} -- A git commit.
 
+    Keyword Arguments:
+        path {Optional[Path]} -- If set, only modifications that touch this path (relative to the root of the repository)
+                                 are extracted, and git only diffs that part of the tree.  Renames across the boundary of
+                                 path are reported as adds or deletes. (default: {None})
+
     Returns:
         List[Modification] -- All modifications contained within the git commit.
     """
 
+    paths = str(path) if path else None
     if commit.parents:
-        diffs = commit.parents[0].diff(commit)
+        diffs = commit.parents[0].diff(commit, paths=paths)
     else:
         # initial commit
-        diffs = commit.diff(NULL_TREE)
+        diffs = commit.diff(NULL_TREE, paths=paths)
+
+    return [Modification.from_diff(d) for d in diffs]
+
 
-    return [Modification.from_diff(d, tree=commit.tree) for d in diffs]
+# number of commits passed to a single git log invocation; keeps the command line comfortably short
+COMMITS_PER_GIT_LOG = 1000
+
+
+def get_modifications_batch(
+    commits: List[Commit], path: Optional[Path] = None
+) -> Dict[str, List[Modification]]:
+    """Extracts all the modifications from many commits at once.  Equivalent to calling get_modifications
+    for each commit, but runs a single git log for the whole batch instead of diffing each commit separately.
+    Source code is read (when first needed) through the repository's object database, which keeps one git process open
+    for all reads.
+
+    Arguments:
+        commits {List[Commit]} -- Git commits, all from the same repository.
+
+    Keyword Arguments:
+        path {Optional[Path]} -- If set, only modifications that touch this path (relative to the root of the repository)
+                                 are extracted.  Renames across the boundary of path are reported as adds or deletes. (default: {None})
+
+    Returns:
+        Dict[str, List[Modification]] -- The modifications contained within each commit, keyed by commit SHA.
+    """
+    modifications: Dict[str, List[Modification]] = {c.hexsha: [] for c in commits}
+    if not commits:
+        return modifications
+
+    repo = commits[0].repo
+    pathspec = [str(path)] if path else []
+    for start in range(0, len(commits), COMMITS_PER_GIT_LOG):
+        shas = [c.hexsha for c in commits[start : start + COMMITS_PER_GIT_LOG]]
+        output = repo.git.log(
+            "--no-walk=unsorted",
+            "--first-parent",
+            "-m",
+            "--root",
+            "-M",
+            "--raw",
+            "--no-abbrev",
+            "-z",
+            "--format=%H",
+            *shas,
+            "--",
+            *pathspec,
+        )
+
+        # with -z every field is NUL terminated: a commit SHA, followed by its raw diff entries each of which is
+        # ":<old mode> <new mode> <old blob> <new blob> <status>" then one path (or two for renames)
+        tokens = iter(output.split("\0"))
+        current: List[Modification] = []
+        for token in tokens:
+            token = token.lstrip("\n")
+            if not token:
+                continue
+            if not token.startswith(":"):
+                current = modifications.setdefault(token, [])
+                continue
+
+            new_blob, status = token.split(" ")[3:5]
+            change_type = MODIFICATION_TYPES_BY_STATUS.get(
+                status[0], ModificationType.UNKNOWN
+            )
+            old_path = next(tokens)
+            new_path = next(tokens) if status[0] in "RC" else old_path
+            source_code = (
+                partial(_read_blob, repo, bytes.fromhex(new_blob))
+                if change_type != ModificationType.DELETE
+                else None
+            )
+
+            mod = Modification(old_path, new_path, change_type, source_code)
+            logger.debug("%s, with source code from blob %s.", mod, new_blob)
+            current.append(mod)
+
+    return modifications
 
 
 def filter_modifications_to_folder(
@@ -203,11 +346,24 @@ def filter_modifications_to_folder(
         Modification -- A modification with all paths relative to the specified folder.
     """
 
-    for mod in modifications:
-        new_path_in_folder = folder in mod.path.parents if mod.path else False
-        old_path_in_folder = (
-            folder in mod.previous_path.parents if mod.previous_path else False
+    folder_parts = folder.parts
+    depth = len(folder_parts)
+
+    def in_folder(path: Optional[Path]) -> bool:
+        # a prefix check on the parts, rather than scanning every one of the path's parents
+        return (
+            path is not None
+            and len(path.parts) > depth
+            and path.parts[:depth] == folder_parts
         )
+
+    def relative_to_folder(path: Path) -> Path:
+        # already known to be inside the folder, so skip relative_to's validation
+        return Path(*path.parts[depth:])
+
+    for mod in modifications:
+        new_path_in_folder = in_folder(mod.path)
+        old_path_in_folder = in_folder(mod.previous_path)
         if new_path_in_folder or old_path_in_folder:
 
             if new_path_in_folder and not old_path_in_folder and mod.previous_path:
@@ -219,15 +375,49 @@ def filter_modifications_to_folder(
 
             yield Modification(
                 (
-                    mod.previous_path.relative_to(folder)
+                    relative_to_folder(mod.previous_path)
                     if mod.previous_path and old_path_in_folder
                     else None
                 ),
                 (
-                    mod.path.relative_to(folder)
+                    relative_to_folder(mod.path)
                     if mod.path and new_path_in_folder
                     else None
                 ),
                 modification_type,
-                mod.source_code,
+                # hand over the unread source, if it hasn't been read yet
+                mod._source_code,
             )
+
+
+def drop_superseded_modifications(
+    modifications_by_commit: Sequence[List[Modification]],
+) -> List[List[Modification]]:
+    """Drops modifications whose result a later commit overwrites anyway.  A file that is modified and then modified
+    again, renamed or deleted by a later commit only needs its content written by that later modification, so when
+    replaying many commits the earlier modify is wasted work.
+
+    Arguments:
+        modifications_by_commit {Sequence[List[Modification]]} -- The modifications of each commit, in chronological order.
+
+    Returns:
+        List[List[Modification]] -- The modifications of each commit, in the same order, minus the superseded ones.
+    """
+    # paths of files that a later commit writes, renames away or deletes
+    touched_later: Set[Path] = set()
+    remaining = []
+    for modifications in reversed(modifications_by_commit):
+        remaining.append(
+            [
+                mod
+                for mod in modifications
+                if mod.change_type != ModificationType.MODIFY
+                or mod.path not in touched_later
+            ]
+        )
+        for mod in modifications:
+            path = mod.previous_path or mod.path
+            if path:
+                touched_later.add(path)
+    remaining.reverse()
+    return remaining
@@ -1,4 +1,5 @@
 import logging
+import queue
 
 from typing import Union, Optional
 
@@ -23,27 +24,46 @@ from junction.markdown.wiki_links import WikiLinkExtension
 logger = logging.getLogger(__name__)
 
 
-junctionMarkdown = Markdown(
-    extensions=[
-        SaneListExtension(),
-        InsertSupExtension(),
-        DeleteSubExtension(),
-        EmDashExtension(),
-        MagiclinkExtension(),
-        ChecklistExtension(),
-        SuperFencesCodeExtension(
-            custom_fences=[
-                {"name": "*", "class": "*", "format": confluence_code_format}
-            ]
-        ),
-        StatusExtension(),
-        TableOfContentsExtension(),
-        ChildrenExtension(),
-        InfoPanelExtension(),
-        WikiLinkExtension(),
-        TableExtension(),
-    ]
-)
+def _create_markdown() -> Markdown:
+    # extensions keep a reference to the Markdown instance they extend, so every instance gets its own
+    return Markdown(
+        extensions=[
+            SaneListExtension(),
+            InsertSupExtension(),
+            DeleteSubExtension(),
+            EmDashExtension(),
+            MagiclinkExtension(),
+            ChecklistExtension(),
+            SuperFencesCodeExtension(
+                custom_fences=[
+                    {"name": "*", "class": "*", "format": confluence_code_format}
+                ]
+            ),
+            StatusExtension(),
+            TableOfContentsExtension(),
+            ChildrenExtension(),
+            InfoPanelExtension(),
+            WikiLinkExtension(),
+            TableExtension(),
+        ]
+    )
+
+
+# Markdown instances are expensive to build and can't be used by two threads at once, so idle instances are
+# pooled and handed out to whichever thread needs one.  Every instance is kept, so the pool grows to the most
+# conversions ever run at once (one per worker converting pages) and no thread has to build an instance twice
+_markdown_pool: "queue.SimpleQueue[Markdown]" = queue.SimpleQueue()
+
+
+def _checkout_markdown() -> Markdown:
+    try:
+        return _markdown_pool.get_nowait()
+    except queue.Empty:
+        return _create_markdown()
+
+
+def _return_markdown(md: Markdown) -> None:
+    _markdown_pool.put(md)
 
 
 def markdown_to_storage(text: Optional[Union[str, bytes]]) -> str:
@@ -53,7 +73,11 @@ def markdown_to_storage(text: Optional[Union[str, bytes]]) -> str:
         text = text.decode("utf-8", "ignore")
 
     logger.debug("Compiling markdown to Confluence storage format: %s", text)
-    result = junctionMarkdown.convert(text)
-    junctionMarkdown.reset()
+    md = _checkout_markdown()
+    try:
+        result = md.convert(text)
+    finally:
+        md.reset()
+        _return_markdown(md)
     logger.debug("Resulting Confluence storage format: %s", result)
     return result
@@ -20,21 +20,19 @@ class ChecklistPostprocessor(Postprocessor):
     - [x] A completed task
     """
 
-    item_with_children_pattern = re.compile(
-        r"<li>\[([ Xx])\]((?!</li>).*)<ul>", re.MULTILINE
-    )
-    item_paragraph_pattern = re.compile(r"<p>\[([ Xx])\](.*)</p>", re.MULTILINE)
-    item_pattern = re.compile(r"<li>\[([ Xx])\](.*)</li>", re.MULTILINE)
+    item_with_children_pattern = re.compile(r"<li>\[([ Xx])\]((?!</li>).*)<ul>")
+    item_paragraph_pattern = re.compile(r"<p>\[([ Xx])\](.*)</p>")
+    item_pattern = re.compile(r"<li>\[([ Xx])\](.*)</li>")
 
     def run(self, html: str) -> str:
         # Converts nested lists that start with a task
-        html = re.sub(
-            self.item_with_children_pattern, self._convert_item_with_children, html
+        html = self.item_with_children_pattern.sub(
+            self._convert_item_with_children, html
         )
         # Converts paragraphs with the task syntax, in case the HTML parser created an extra line
-        html = re.sub(self.item_paragraph_pattern, self._convert_item, html)
+        html = self.item_paragraph_pattern.sub(self._convert_item, html)
         # Converts regular list items
-        html = re.sub(self.item_pattern, self._convert_item, html)
+        html = self.item_pattern.sub(self._convert_item, html)
         return html
 
     def _convert_item(self, match: re.Match) -> str:
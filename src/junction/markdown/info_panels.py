@@ -2,7 +2,6 @@ from typing import List, Any
 from markdown import Markdown
 from markdown.extensions import Extension
 from markdown.blockprocessors import BlockProcessor
-import re
 import xml.etree.ElementTree as etree
 
 
@@ -56,15 +55,13 @@ class InfoPanelBlockProcessor(BlockProcessor):
         self, prefix: str, name: str, macro_id: str, *args: Any, **kwargs: Any
     ):
         self._prefix = prefix
-        self._block_re = re.compile(
-            r"\s*{}.*".format(prefix), re.MULTILINE | re.DOTALL | re.VERBOSE
-        )
         self._name = name
         self._macro_id = macro_id
         super().__init__(*args, **kwargs)
 
     def test(self, parent: etree.Element, block: str) -> bool:
-        return bool(self._block_re.match(block))
+        # every block is tested against each kind of panel, so avoid a regex for what is just a prefix check
+        return block.lstrip().startswith(self._prefix)
 
     def run(self, parent: etree.Element, blocks: List[str]) -> None:
         raw_content = blocks.pop(0).lstrip(self._prefix).lstrip()
@@ -17,37 +17,43 @@ class StatusExtension(Extension):
     """
 
     def extendMarkdown(self, md: Markdown) -> None:
-        md.inlinePatterns.register(StatusPattern("red"), "status-red", 25)
-        md.inlinePatterns.register(StatusPattern("yellow"), "status-yellow", 25)
-        md.inlinePatterns.register(StatusPattern("green"), "status-green", 25)
-        md.inlinePatterns.register(StatusPattern("grey"), "status-grey", 25)
-        md.inlinePatterns.register(StatusPattern("purple"), "status-purple", 25)
-        md.inlinePatterns.register(StatusPattern("blue"), "status-blue", 25)
+        md.inlinePatterns.register(StatusPattern(), "status", 25)
+
+
+# colors supported by the status macro, with the spelling Confluence expects for each
+STATUS_COLOURS = {
+    color: color.capitalize()
+    for color in ("red", "yellow", "green", "grey", "purple", "blue")
+}
+
+# attributes of every status macro; ElementTree copies the attributes it is given, so these can be shared
+_MACRO_ATTRIBUTES = {
+    "ac:name": "status",
+    "ac:schema-version": "1",
+    "ac:macro-id": "d4fcf299-d2f0-4eec-807a-1e4a3c8fe0dc",
+}
+_TITLE_ATTRIBUTES = {"ac:name": "title"}
+_COLOUR_ATTRIBUTES = {"ac:name": "colour"}
 
 
 class StatusPattern(InlineProcessor):
-    def __init__(self, color: str):
-        self._color = color
-        super().__init__(r"&status-{}:(?P<title>[^;]+);".format(self._color))
+    def __init__(self) -> None:
+        # one pattern for every color, so each piece of inline text is searched once rather than once per color
+        super().__init__(
+            r"&status-(?P<color>{}):(?P<title>[^;]+);".format("|".join(STATUS_COLOURS))
+        )
 
     def handleMatch(  # type: ignore
         self, match: re.Match[str], data: str
     ) -> Tuple[etree.Element, int, int]:
-        el = etree.Element(
-            "ac:structured-macro",
-            {
-                "ac:name": "status",
-                "ac:schema-version": "1",
-                "ac:macro-id": "d4fcf299-d2f0-4eec-807a-1e4a3c8fe0dc",
-            },
-        )
+        el = etree.Element("ac:structured-macro", _MACRO_ATTRIBUTES)
 
-        etree.SubElement(el, "ac:parameter", {"ac:name": "title"}).text = match.group(
+        etree.SubElement(el, "ac:parameter", _TITLE_ATTRIBUTES).text = match.group(
             "title"
         )
-        etree.SubElement(el, "ac:parameter", {"ac:name": "colour"}).text = (
-            self._color.capitalize()
-        )
+        etree.SubElement(el, "ac:parameter", _COLOUR_ATTRIBUTES).text = STATUS_COLOURS[
+            match.group("color")
+        ]
 
         return el, match.start(0), match.end(0)
 
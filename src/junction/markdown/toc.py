@@ -2,7 +2,6 @@ from typing import List, Any
 from markdown import Markdown
 from markdown.extensions import Extension
 from markdown.blockprocessors import BlockProcessor
-import re
 import xml.etree.ElementTree as etree
 
 
@@ -19,12 +18,8 @@ class TableOfContentsExtension(Extension):
 
 
 class TableOfContentsBlockProcessor(BlockProcessor):
-    TOC_BLOCK_RE = re.compile(
-        r"\s*:include-toc:\s*", re.MULTILINE | re.DOTALL | re.VERBOSE
-    )
-
     def test(self, parent: etree.Element, block: str) -> bool:
-        return bool(self.TOC_BLOCK_RE.match(block))
+        return block.lstrip().startswith(":include-toc:")
 
     def run(self, parent: etree.Element, blocks: List[str]) -> None:
         blocks.pop(0)
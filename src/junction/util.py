@@ -1,10 +1,10 @@
-from typing import Callable, TypeVar, Iterable, Any
+from typing import Callable, TypeVar, Iterable, Any, ItemsView, ValuesView
 
-from collections import OrderedDict
-from collections.abc import Mapping
 
 T = TypeVar("T")
 
+_MISSING = object()
+
 
 class JunctionError(Exception):
     pass
@@ -21,34 +21,55 @@ def for_all(items: Iterable[T], action: Callable[[T], None]) -> None:
         action(item)
 
 
-class DotDict(OrderedDict):
+class DotDict(dict):
     """
     Quick and dirty implementation of a dot-able dict, which allows access and
     assignment via object properties rather than dict indexing.
+
+    Nested mappings are wrapped into DotDict's lazily, the first time they are accessed,
+    so the parts of a (potentially large) decoded JSON blob that are never read are never copied.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any):
-        # we could just call super(DotDict, self).__init__(*args, **kwargs)
-        # but that won't get us nested dotdict objects
-        od = OrderedDict(*args, **kwargs)
-        for key, val in od.items():
-            if isinstance(val, Mapping):
-                value = DotDict(val)
-            else:
-                value = val
-            self[key] = value
+    # attributes are stored as dict items, so instances don't need a __dict__ of their own
+    __slots__ = ()
+
+    def __getitem__(self, k: Any) -> Any:
+        return self._wrap(k, super().__getitem__(k))
+
+    def get(self, k: Any, default: Any = None) -> Any:
+        value = super().get(k, _MISSING)
+        return default if value is _MISSING else self._wrap(k, value)
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        self._wrap_all()
+        return super().values()
+
+    def items(self) -> ItemsView[Any, Any]:  # type: ignore[override]
+        self._wrap_all()
+        return super().items()
+
+    def _wrap_all(self) -> None:
+        # iterating values hands them out without going through __getitem__, so wrap every nested mapping up front;
+        # replacing the value of an existing key doesn't disturb the iteration
+        for k, value in super().items():
+            self._wrap(k, value)
+
+    def _wrap(self, k: Any, value: Any) -> Any:
+        # values come from json.loads, so a nested mapping is always an exact dict until it has been wrapped
+        if type(value) is dict:
+            value = DotDict(value)
+            super().__setitem__(k, value)
+        return value
 
     def __delattr__(self, name: Any) -> None:
-        try:
-            del self[name]
-        except KeyError as ex:
-            raise AttributeError(f"No attribute called: {name}") from ex
+        if super().pop(name, _MISSING) is _MISSING:
+            raise AttributeError(f"No attribute called: {name}")
 
     def __getattr__(self, k: Any) -> Any:
-        try:
-            return self[k]
-        except KeyError as ex:
-            raise AttributeError(f"No attribute called: {k}") from ex
+        # every attribute read on a DotDict lands here, so avoid raising/catching a KeyError for the common hit
+        value = super().get(k, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"No attribute called: {k}")
+        return self._wrap(k, value)
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        self[name] = value
+    __setattr__ = dict.__setitem__